@@ -3,9 +3,15 @@ PDF Conversion API - Simplified.
 Sync processing for small files (<20 pages), async for larger.
 """
 
+import asyncio
+import hashlib
 import os
-import uuid
+import shutil
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
+from secrets import token_urlsafe
 
 from fastapi import APIRouter, BackgroundTasks, File, Form, HTTPException, UploadFile
 from fastapi.responses import FileResponse
@@ -13,32 +19,97 @@ from fastapi.responses import FileResponse
 from app.config import settings
 from app.models.schemas import ConvertResponse, JobStatus, OCRProvider
 from app.services.job_manager import job_manager
+from app.services.process_pool import run_in_pool
 
 router = APIRouter()
 
 # Threshold for sync vs async processing
 SYNC_PAGE_LIMIT = 20
 
+# Maximum number of files accepted by /convert/batch
+MAX_BATCH_FILES = 5
+
+# Uploads are streamed to disk in chunks of this size (multiple of 4 KB pages)
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+# Path separators, drive colon and control characters are not allowed in saved filenames
+_FILENAME_TRANS = str.maketrans(
+    {c: "_" for c in ["/", "\\", ":", *map(chr, range(32)), "\x7f"]}
+)
+
+# Dedicated pool for upload writes, so they don't contend with the default executor
+_io_executor = ThreadPoolExecutor(
+    max_workers=(os.cpu_count() or 1) * 2, thread_name_prefix="upload-io"
+)
+
+# Page counts cached by content fingerprint (first 64 KB + size).
+# Only used to pick sync vs background processing, so a rare collision is harmless.
+PAGE_COUNT_CACHE_SIZE = 512
+_FINGERPRINT_HEAD_BYTES = 64 * 1024
+_page_count_cache: OrderedDict[str, int] = OrderedDict()
+
 
 def generate_job_id() -> str:
-    return str(uuid.uuid4())[:12]
+    # 12 URL-safe chars from 9 random bytes (72 bits of entropy)
+    return token_urlsafe(9)
 
 
-async def save_file(file: UploadFile, job_id: str) -> tuple[str, bytes]:
-    """Save uploaded file and return path + content."""
+def _write_all(fd: int, data: bytes) -> None:
+    """Write the whole buffer to fd (os.write may write partially)."""
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
+async def save_file(file: UploadFile, job_id: str) -> tuple[str, int, bytes]:
+    """
+    Stream uploaded file to disk and return path, size and head bytes.
+
+    The PDF magic bytes are checked on the first chunk and the size limit
+    is enforced while streaming, so the full upload is never held in memory.
+    Raises HTTPException (and removes the partial upload) if a check fails.
+    """
     upload_dir = os.path.join(settings.storage_path, "uploads", job_id)
     os.makedirs(upload_dir, exist_ok=True)
 
-    filename = file.filename or "document.pdf"
     # Sanitize filename
-    filename = filename.replace("/", "_").replace("\\", "_")[:200]
+    filename = (file.filename or "document.pdf").translate(_FILENAME_TRANS)[:200]
     file_path = os.path.join(upload_dir, filename)
 
-    content = await file.read()
-    with open(file_path, "wb") as f:
-        f.write(content)
-
-    return file_path, content
+    loop = asyncio.get_running_loop()
+    size = 0
+    head = b""
+    try:
+        fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                if size == 0:
+                    # Check magic bytes; keep the head for the page-count cache key
+                    if memoryview(chunk)[:4] != b"%PDF":
+                        raise HTTPException(400, "Invalid PDF file")
+                    head = chunk[:_FINGERPRINT_HEAD_BYTES]
+
+                size += len(chunk)
+                if size > settings.max_file_size_bytes:
+                    raise HTTPException(
+                        413, f"File too large. Max: {settings.max_file_size_mb}MB"
+                    )
+
+                # Large writes go off the event loop
+                await loop.run_in_executor(_io_executor, _write_all, fd, chunk)
+        finally:
+            os.close(fd)
+
+        if size == 0:
+            raise HTTPException(400, "Invalid PDF file")
+    except BaseException:
+        # Includes CancelledError: a client disconnecting mid-upload must not
+        # leave a partial upload directory behind
+        shutil.rmtree(upload_dir, ignore_errors=True)
+        raise
+
+    return file_path, size, head
 
 
 @router.post("/convert", response_model=ConvertResponse)
@@ -59,30 +130,22 @@ async def convert_pdf(
     if not file.filename or not file.filename.lower().endswith(".pdf"):
         raise HTTPException(400, "Only PDF files are supported")
 
-    content = await file.read()
-
-    # Check magic bytes
-    if not content.startswith(b"%PDF"):
-        raise HTTPException(400, "Invalid PDF file")
-
-    # Check file size
-    if len(content) > settings.max_file_size_bytes:
+    # Reject early when the client declared the size
+    if file.size is not None and file.size > settings.max_file_size_bytes:
         raise HTTPException(413, f"File too large. Max: {settings.max_file_size_mb}MB")
 
-    await file.seek(0)
-
-    # Generate job ID and save file
+    # Generate job ID and save file (validates magic bytes and size)
     job_id = generate_job_id()
-    file_path, _ = await save_file(file, job_id)
+    file_path, file_size, head = await save_file(file, job_id)
 
     # Quick page count check
-    page_count = await get_page_count(file_path)
+    page_count = await get_page_count(file_path, file_size, head)
 
     # Create job record
     job = await job_manager.create_job(
         job_id=job_id,
         filename=file.filename,
-        file_size=len(content),
+        file_size=file_size,
         file_path=file_path,
         settings={
             "ocr_enabled": ocr_enabled,
@@ -129,58 +192,74 @@ async def batch_convert(
     Batch convert multiple PDFs (max 5).
     All files are processed in background.
     """
-    if len(files) > 5:
-        raise HTTPException(400, "Maximum 5 files per batch")
+    if len(files) > MAX_BATCH_FILES:
+        raise HTTPException(400, f"Maximum {MAX_BATCH_FILES} files per batch")
 
-    results = []
+    results: list[dict] = [{} for _ in files]
+    pending: list[tuple[int, UploadFile, str]] = []
 
-    for file in files:
+    for idx, file in enumerate(files):
         if not file.filename or not file.filename.lower().endswith(".pdf"):
-            results.append(
-                {"filename": file.filename, "success": False, "error": "Not a PDF"}
-            )
+            results[idx] = {
+                "filename": file.filename,
+                "success": False,
+                "error": "Not a PDF",
+            }
+            continue
+        if file.size is not None and file.size > settings.max_file_size_bytes:
+            results[idx] = {
+                "filename": file.filename,
+                "success": False,
+                "error": "Too large",
+            }
             continue
+        pending.append((idx, file, generate_job_id()))
 
-        try:
-            content = await file.read()
-            if not content.startswith(b"%PDF"):
-                results.append(
-                    {
-                        "filename": file.filename,
-                        "success": False,
-                        "error": "Invalid PDF",
-                    }
-                )
-                continue
+    # Save all uploads concurrently so their disk writes overlap
+    saved = await asyncio.gather(
+        *(save_file(file, job_id) for _, file, job_id in pending),
+        return_exceptions=True,
+    )
 
-            if len(content) > settings.max_file_size_bytes:
-                results.append(
-                    {"filename": file.filename, "success": False, "error": "Too large"}
-                )
-                continue
+    queued: list[str] = []
 
-            await file.seek(0)
+    for (idx, file, job_id), outcome in zip(pending, saved):
+        if isinstance(outcome, HTTPException):
+            error = "Too large" if outcome.status_code == 413 else "Invalid PDF"
+            results[idx] = {"filename": file.filename, "success": False, "error": error}
+            continue
 
-            job_id = generate_job_id()
-            file_path, _ = await save_file(file, job_id)
+        try:
+            if isinstance(outcome, BaseException):
+                raise outcome
+
+            file_path, file_size, _ = outcome
 
             await job_manager.create_job(
                 job_id=job_id,
                 filename=file.filename,
-                file_size=len(content),
+                file_size=file_size,
                 file_path=file_path,
                 settings={"ocr_enabled": ocr_enabled, "language": language},
             )
 
-            background_tasks.add_task(process_pdf, job_id)
-            results.append(
-                {"filename": file.filename, "success": True, "job_id": job_id}
-            )
+            queued.append(job_id)
+            results[idx] = {
+                "filename": file.filename,
+                "success": True,
+                "job_id": job_id,
+            }
 
         except Exception as e:
-            results.append(
-                {"filename": file.filename, "success": False, "error": str(e)}
-            )
+            results[idx] = {
+                "filename": file.filename,
+                "success": False,
+                "error": str(e),
+            }
+
+    # One background task for the whole batch so the jobs run concurrently
+    if queued:
+        background_tasks.add_task(_run_batch, queued)
 
     success_count = sum(1 for r in results if r.get("success"))
     return {
@@ -189,17 +268,41 @@ async def batch_convert(
     }
 
 
-async def get_page_count(file_path: str) -> int:
-    """Quick page count without full analysis."""
-    try:
-        import fitz
+def _pdf_fingerprint(head: bytes, file_size: int) -> str:
+    """Cheap content key: hash of the first 64 KB plus the total size."""
+    digest = hashlib.blake2b(head, digest_size=16)
+    digest.update(str(file_size).encode())
+    return digest.hexdigest()
+
+
+async def get_page_count(file_path: str, file_size: int, head: bytes) -> int:
+    """Quick page count without full analysis, cached for repeated uploads."""
+    from app.services.pdf_service import count_pages
 
-        doc = fitz.open(file_path)
-        count = len(doc)
-        doc.close()
+    try:
+        key = _pdf_fingerprint(head, file_size)
+        count = _page_count_cache.get(key)
+        if count is not None:
+            _page_count_cache.move_to_end(key)
+            return count
+
+        # MuPDF parsing runs in worker processes so it never blocks the event loop
+        count = await run_in_pool(count_pages, file_path)
+
+        _page_count_cache[key] = count
+        if len(_page_count_cache) > PAGE_COUNT_CACHE_SIZE:
+            _page_count_cache.popitem(last=False)
         return count
+    except BrokenProcessPool:
+        # Workers keep dying even on a fresh pool; that's not a bad PDF
+        raise
     except Exception:
-        return 999  # Assume large on error
+        return 999  # Assume large on error (e.g. a PDF MuPDF can't parse)
+
+
+async def _run_batch(job_ids: list[str]) -> None:
+    """Process all jobs of a batch concurrently."""
+    await asyncio.gather(*(process_pdf(job_id) for job_id in job_ids))
 
 
 async def process_pdf(job_id: str) -> dict:
@@ -270,13 +373,12 @@ async def process_pdf(job_id: str) -> dict:
         # Generate DOCX
         await job_manager.update_job(job_id, message="Generating DOCX...", progress=85)
 
-        output_dir = os.path.join(settings.storage_path, "output", job_id)
-        output_filename = os.path.splitext(job["filename"])[0] + ".docx"
-
-        output_path = await docx_service.generate(
+        # python-docx work is CPU-bound; run the whole generation off the event loop
+        output_path = await asyncio.to_thread(
+            docx_service.generate,
             structure=structure,
-            output_dir=output_dir,
-            filename=output_filename,
+            output_dir=job["output_dir"],
+            filename=job["output_filename"],
         )
 
         # Complete
@@ -7,6 +7,7 @@ Handles secure file downloads for completed conversion jobs.
 import os
 from datetime import datetime, timedelta
 from typing import Optional
+from urllib.parse import quote
 
 from fastapi import APIRouter, HTTPException, Response
 from fastapi.responses import FileResponse, StreamingResponse
@@ -17,6 +18,13 @@ from app.services.job_manager import job_manager
 
 router = APIRouter()
 
+_DOCX_MIME = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+_DOWNLOAD_CACHE_HEADERS = (
+    ("Cache-Control", "no-cache, no-store, must-revalidate"),
+    ("Pragma", "no-cache"),
+    ("Expires", "0"),
+)
+
 
 @router.get(
     "/download/{job_id}",
@@ -56,39 +64,38 @@ async def download_file(job_id: str):
             detail=f"Job is not completed. Current status: {job.status}",
         )
 
-    # Get raw job data to access output_path
-    raw_job = job_manager.get_raw_job(job_id)
-    if not raw_job:
-        raise HTTPException(status_code=404, detail="Job data not found")
-
-    output_path = raw_job.get("output_path")
-
-    if not output_path or not os.path.exists(output_path):
-        # Try to find the file in the expected location
-        output_dir = os.path.join(settings.storage_path, "output", job_id)
-        expected_filename = os.path.splitext(job.filename)[0] + ".docx"
-        output_path = os.path.join(output_dir, expected_filename)
-
-        if not os.path.exists(output_path):
-            raise HTTPException(
-                status_code=404,
-                detail="Output file not found. It may have been deleted.",
-            )
+    # Stat the file now rather than trusting a cached result, so a deleted
+    # output is a 404 instead of a failure halfway through the response
+    resolved = job_manager.get_output_stat(job_id, fresh=True)
+    if not resolved:
+        raise HTTPException(
+            status_code=404,
+            detail="Output file not found. It may have been deleted.",
+        )
+    output_path, file_stat = resolved
 
     # Get filename for download
     download_filename = os.path.basename(output_path)
+    headers = dict(_DOWNLOAD_CACHE_HEADERS)
+    headers["Content-Disposition"] = f'attachment; filename="{download_filename}"'
+
+    # Behind nginx: let it send the file straight from page cache (sendfile)
+    accel_prefix = settings.download_accel_redirect_prefix
+    if accel_prefix:
+        relative_path = os.path.relpath(output_path, settings.storage_path)
+        if not relative_path.startswith(".."):
+            headers["X-Accel-Redirect"] = (
+                f"{accel_prefix.rstrip('/')}/{quote(relative_path)}"
+            )
+            return Response(media_type=_DOCX_MIME, headers=headers)
 
     # Return file response
     return FileResponse(
         path=output_path,
         filename=download_filename,
-        media_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-        headers={
-            "Content-Disposition": f'attachment; filename="{download_filename}"',
-            "Cache-Control": "no-cache, no-store, must-revalidate",
-            "Pragma": "no-cache",
-            "Expires": "0",
-        },
+        media_type=_DOCX_MIME,
+        headers=headers,
+        stat_result=file_stat,
     )
 
 
@@ -115,20 +122,12 @@ async def get_download_info(job_id: str):
             detail=f"Job not completed. Status: {job.status}",
         )
 
-    # Get raw job data
-    raw_job = job_manager.get_raw_job(job_id)
-    output_path = raw_job.get("output_path") if raw_job else None
-
-    if not output_path or not os.path.exists(output_path):
-        output_dir = os.path.join(settings.storage_path, "output", job_id)
-        expected_filename = os.path.splitext(job.filename)[0] + ".docx"
-        output_path = os.path.join(output_dir, expected_filename)
-
-    if not os.path.exists(output_path):
+    resolved = job_manager.get_output_stat(job_id)
+    if not resolved:
         raise HTTPException(status_code=404, detail="Output file not found")
 
     # Get file info
-    file_stat = os.stat(output_path)
+    output_path, file_stat = resolved
     filename = os.path.basename(output_path)
 
     return {
@@ -139,7 +138,7 @@ async def get_download_info(job_id: str):
         "file_size_human": _format_file_size(file_stat.st_size),
         "download_url": f"/api/v1/download/{job_id}",
         "created_at": datetime.fromtimestamp(file_stat.st_ctime).isoformat(),
-        "content_type": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+        "content_type": _DOCX_MIME,
     }
 
 
@@ -159,35 +158,27 @@ async def download_file_head(job_id: str):
     if job.status != JobStatus.COMPLETED:
         raise HTTPException(status_code=400, detail="Job not completed")
 
-    # Get raw job data
-    raw_job = job_manager.get_raw_job(job_id)
-    output_path = raw_job.get("output_path") if raw_job else None
-
-    if not output_path or not os.path.exists(output_path):
-        output_dir = os.path.join(settings.storage_path, "output", job_id)
-        expected_filename = os.path.splitext(job.filename)[0] + ".docx"
-        output_path = os.path.join(output_dir, expected_filename)
-
-    if not os.path.exists(output_path):
+    resolved = job_manager.get_output_stat(job_id)
+    if not resolved:
         raise HTTPException(status_code=404, detail="File not found")
 
-    file_stat = os.stat(output_path)
+    output_path, file_stat = resolved
     filename = os.path.basename(output_path)
 
     return Response(
         headers={
             "Content-Length": str(file_stat.st_size),
-            "Content-Type": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+            "Content-Type": _DOCX_MIME,
             "Content-Disposition": f'attachment; filename="{filename}"',
             "Accept-Ranges": "bytes",
         }
     )
 
 
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+
 def _format_file_size(size_bytes: int) -> str:
     """Format file size in human-readable format."""
-    for unit in ["B", "KB", "MB", "GB"]:
-        if size_bytes < 1024:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024
-    return f"{size_bytes:.1f} TB"
+    idx = min((size_bytes.bit_length() - 1) // 10, 4) if size_bytes > 0 else 0
+    return f"{size_bytes / (1 << (idx * 10)):.1f} {_SIZE_UNITS[idx]}"
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import os
 import time
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
 
 from fastapi import APIRouter
@@ -12,6 +12,13 @@ from app.config import settings
 
 router = APIRouter()
 
+_SERVICE_STATUS_ALIVE = {"status": "alive"}
+
+# Probe results are reused for a short time so frequent k8s/Railway probes
+# don't repeat the storage write on every hit
+HEALTH_CACHE_TTL = 2.0
+_health_cache: Optional[tuple[float, ServiceStatus, ServiceStatus]] = None
+
 
 class ServiceStatus(BaseModel):
     name: str
@@ -24,7 +31,7 @@ class HealthResponse(BaseModel):
     status: str = Field(description="healthy | degraded | unhealthy")
     version: str
     environment: str
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     services: dict[str, bool] = Field(default_factory=dict)
     details: list[ServiceStatus] = Field(default_factory=list)
 
@@ -38,7 +45,7 @@ async def liveness_probe():
     Do not perform external checks here (Redis/S3/DB/API), because they can
     cause deploy healthchecks to fail even when the app is fine.
     """
-    return {"status": "alive"}
+    return _SERVICE_STATUS_ALIVE
 
 
 @router.get("/health", response_model=HealthResponse)
@@ -47,13 +54,7 @@ async def health_check():
     Detailed health endpoint.
     This can include best-effort checks and may return degraded/unhealthy.
     """
-    details: list[ServiceStatus] = []
-
-    # Storage check (local path)
-    details.append(_check_local_storage())
-
-    # OCR config check (only checks key presence, does not call external API)
-    details.append(_check_ocr_config())
+    details: list[ServiceStatus] = list(_run_checks())
 
     services = {s.name: s.healthy for s in details}
 
@@ -83,8 +84,7 @@ async def readiness_probe():
 
     We keep it simple: storage must be writable and at least one OCR option is configured.
     """
-    storage = _check_local_storage()
-    ocr = _check_ocr_config()
+    storage, ocr = _run_checks()
 
     if storage.healthy and ocr.healthy:
         return {"status": "ready"}
@@ -98,6 +98,23 @@ async def readiness_probe():
     }
 
 
+def _run_checks() -> tuple[ServiceStatus, ServiceStatus]:
+    """Return (storage, ocr) statuses, cached for HEALTH_CACHE_TTL seconds."""
+    global _health_cache
+
+    now = time.monotonic()
+    if _health_cache and now - _health_cache[0] < HEALTH_CACHE_TTL:
+        return _health_cache[1], _health_cache[2]
+
+    # Storage check (local path)
+    storage = _check_local_storage()
+    # OCR config check (only checks key presence, does not call external API)
+    ocr = _check_ocr_config()
+
+    _health_cache = (now, storage, ocr)
+    return storage, ocr
+
+
 def _check_local_storage() -> ServiceStatus:
     start = time.time()
     try:
@@ -8,6 +8,7 @@ from datetime import datetime
 from typing import Optional
 
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 
 from app.models.schemas import (
     ErrorResponse,
@@ -46,7 +47,11 @@ async def get_job_status(job_id: str):
     return job
 
 
-@router.get("/jobs", response_model=list[JobResponse])
+@router.get(
+    "/jobs",
+    response_model=None,
+    responses={200: {"model": list[JobResponse]}},
+)
 async def list_jobs(
     status: Optional[JobStatus] = Query(None, description="Filter by job status"),
     limit: int = Query(
@@ -62,7 +67,8 @@ async def list_jobs(
     """
     jobs = await job_manager.list_jobs(status=status, limit=limit, offset=offset)
 
-    return jobs
+    # Items are already JobResponse models; skip re-validating them as response_model
+    return ORJSONResponse(content=[job.model_dump(mode="json") for job in jobs])
 
 
 @router.delete(
@@ -82,26 +88,21 @@ async def cancel_job(job_id: str):
     Only jobs in 'pending' or 'processing' status can be cancelled.
     Completed or failed jobs cannot be cancelled.
     """
-    job = await job_manager.get_job(job_id)
+    job, cancelled = await job_manager.cancel_job(job_id)
 
     if not job:
         raise HTTPException(status_code=404, detail=f"Job with ID '{job_id}' not found")
 
-    if job.status in [JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED]:
+    if not cancelled:
         raise HTTPException(
             status_code=409, detail=f"Cannot cancel job in '{job.status}' state"
         )
 
-    success = await job_manager.cancel_job(job_id)
-
-    if success:
-        return {
-            "job_id": job_id,
-            "status": "cancelled",
-            "message": "Job has been cancelled",
-        }
-
-    raise HTTPException(status_code=500, detail="Failed to cancel job")
+    return {
+        "job_id": job_id,
+        "status": "cancelled",
+        "message": "Job has been cancelled",
+    }
 
 
 @router.get(
@@ -3,13 +3,23 @@ Application configuration using Pydantic Settings.
 Loads environment variables from .env file.
 """
 
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from typing import Literal
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+@lru_cache(maxsize=4)
+def _parse_cors(raw: str) -> tuple[str, ...]:
+    """Split a comma-separated origins string, dropping empty entries."""
+    return tuple(origin.strip() for origin in raw.split(",") if origin.strip())
+
+
 class Settings(BaseSettings):
-    """Application settings loaded from environment variables."""
+    """
+    Application settings loaded from environment variables.
+
+    Derived values are cached_property: settings are not mutated after load.
+    """
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -43,6 +53,11 @@ class Settings(BaseSettings):
     s3_secret_key: str | None = None
     s3_bucket: str | None = None
     s3_region: str = "us-east-1"
+    # Internal nginx location mapped to storage_path; when set, downloads are
+    # handed to nginx via X-Accel-Redirect so it can serve them with sendfile
+    download_accel_redirect_prefix: str = ""
+    # Write large local uploads with O_DIRECT (bypasses the page cache; Linux)
+    storage_direct_io: bool = False
 
     # Processing Settings
     max_file_size_mb: int = 100
@@ -52,6 +67,10 @@ class Settings(BaseSettings):
     # OCR Settings
     default_ocr_provider: Literal["mistral", "deepseek", "surya"] = "mistral"
     ocr_timeout_seconds: int = 300
+    # Max in-flight DeepSeek requests per provider instance
+    deepseek_max_concurrency: int = 8
+    # DeepSeek requests per second (0 = unlimited)
+    deepseek_rps: float = 5.0
 
     # CORS
     cors_origins: str = "http://localhost:3000,http://localhost:5173"
@@ -63,21 +82,21 @@ class Settings(BaseSettings):
     log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = "INFO"
 
     @property
-    def cors_origins_list(self) -> list[str]:
+    def cors_origins_list(self) -> tuple[str, ...]:
         """Parse CORS origins from comma-separated string."""
-        return [origin.strip() for origin in self.cors_origins.split(",")]
+        return _parse_cors(self.cors_origins)
 
-    @property
+    @cached_property
     def is_development(self) -> bool:
         """Check if running in development mode."""
         return self.app_env == "development"
 
-    @property
+    @cached_property
     def is_production(self) -> bool:
         """Check if running in production mode."""
         return self.app_env == "production"
 
-    @property
+    @cached_property
     def max_file_size_bytes(self) -> int:
         """Convert max file size to bytes."""
         return self.max_file_size_mb * 1024 * 1024
@@ -6,7 +6,7 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 
 from app.api.routes import convert, download, health, jobs
 from app.config import settings
@@ -33,6 +33,7 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware
@@ -45,6 +46,50 @@ app.add_middleware(
 )
 
 
+# Multipart framing allowance on top of the upload size limit
+MULTIPART_OVERHEAD_BYTES = 1024 * 1024
+
+
+class RequestSizeLimitMiddleware:
+    """
+    Reject oversized uploads by Content-Length before the body is read.
+
+    Plain ASGI middleware: only the request headers in scope are inspected,
+    so other requests pass straight through without extra wrapping.
+    """
+
+    def __init__(self, app, max_bytes: int):
+        self.app = app
+        self.max_bytes = max_bytes
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and self._too_large(scope["headers"]):
+            response = JSONResponse(
+                status_code=413,
+                content={
+                    "error": "Request too large",
+                    "detail": f"Max file size: {settings.max_file_size_mb}MB",
+                },
+            )
+            await response(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
+
+    def _too_large(self, headers: list[tuple[bytes, bytes]]) -> bool:
+        """Check the raw Content-Length header against the limit."""
+        for name, value in headers:
+            if name == b"content-length":
+                return value.isdigit() and int(value) > self.max_bytes
+        return False
+
+
+app.add_middleware(
+    RequestSizeLimitMiddleware,
+    max_bytes=settings.max_file_size_bytes * convert.MAX_BATCH_FILES
+    + MULTIPART_OVERHEAD_BYTES,
+)
+
+
 # Include routers
 app.include_router(health.router, tags=["Health"])
 app.include_router(convert.router, prefix="/api/v1", tags=["Convert"])
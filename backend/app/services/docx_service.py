@@ -9,20 +9,82 @@ This service is responsible for:
 - Managing page layout and margins
 """
 
+import base64
 import io
 import os
+import re
 from dataclasses import dataclass
+from functools import lru_cache, partial
 from typing import Optional
 
 from docx import Document
-from docx.enum.table import WD_TABLE_ALIGNMENT
-from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_LINE_SPACING
-from docx.oxml import OxmlElement
+from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.oxml.ns import qn
-from docx.shared import Cm, Inches, Pt, RGBColor
+from docx.shared import Inches, Pt, RGBColor
 
+# Clark-notation name of the East Asian font attribute (qn parses once here)
+_EAST_ASIA = qn("w:eastAsia")
 
-@dataclass
+# List item prefixes stripped by _clean_list_content
+_BULLETS = ("•", "-", "*", "–", "◦", "○", "●", "■", "□")
+_NUM_PREFIX_RE = re.compile(r"\d+[.)]\s*")
+_ALPHA_PREFIX_RE = re.compile(r"[a-zA-Z][.)]\s*")
+
+_ALIGNMENTS = {
+    "left": WD_ALIGN_PARAGRAPH.LEFT,
+    "center": WD_ALIGN_PARAGRAPH.CENTER,
+    "right": WD_ALIGN_PARAGRAPH.RIGHT,
+    "justify": WD_ALIGN_PARAGRAPH.JUSTIFY,
+}
+
+# Shared stand-in for missing element metadata
+_EMPTY: dict = {}
+
+
+@lru_cache(maxsize=256)
+def _hex_to_rgb(hex_color: str) -> Optional[RGBColor]:
+    """Parse a "#rrggbb" color (cached: documents reuse few colors)."""
+    try:
+        hex_color = hex_color.lstrip("#")
+        r = int(hex_color[0:2], 16)
+        g = int(hex_color[2:4], 16)
+        b = int(hex_color[4:6], 16)
+        return RGBColor(r, g, b)
+    except (ValueError, IndexError):
+        return None  # Invalid color
+
+
+# Directories this process has already created (or found) for output
+_ensured_dirs: set[str] = set()
+
+
+def _ensure_dir(path: str) -> None:
+    """Create a directory once per process instead of on every save."""
+    if path not in _ensured_dirs:
+        os.makedirs(path, exist_ok=True)
+        _ensured_dirs.add(path)
+
+
+def _save_document(doc: Document, output_path: str) -> None:
+    """Save a document, creating its directory if this process hasn't yet."""
+    directory = os.path.dirname(output_path) or "."
+    _ensure_dir(directory)
+    try:
+        doc.save(output_path)
+    except FileNotFoundError:
+        # Directory was removed since it was cached
+        _ensured_dirs.discard(directory)
+        _ensure_dir(directory)
+        doc.save(output_path)
+
+
+# Warm the cache with the colors most runs use
+for _color in ("#000000", "#ffffff", "#ff0000", "#008000", "#0000ff", "#808080"):
+    _hex_to_rgb(_color)
+del _color
+
+
+@dataclass(slots=True, frozen=True)
 class DOCXSettings:
     """Settings for DOCX generation."""
 
@@ -51,6 +113,10 @@ class DOCXSettings:
     image_quality: int = 95
 
 
+# Settings are immutable, so services built without custom settings share one
+_DEFAULT_SETTINGS = DOCXSettings()
+
+
 class DOCXService:
     """
     Service for generating DOCX documents from structured content.
@@ -66,9 +132,43 @@ class DOCXService:
         Args:
             settings: Optional custom settings for DOCX generation
         """
-        self.settings = settings or DOCXSettings()
+        self.settings = settings or _DEFAULT_SETTINGS
+
+        # Lengths are built once here instead of per run/cell/image
+        s = self.settings
+        self._pt_default = Pt(s.default_font_size)
+        self._heading_pt = {
+            1: Pt(s.heading_1_size),
+            2: Pt(s.heading_2_size),
+            3: Pt(s.heading_3_size),
+        }
+        self._page_width = Inches(s.page_width_inches)
+        self._page_height = Inches(s.page_height_inches)
+        self._margin_top = Inches(s.margin_top_inches)
+        self._margin_bottom = Inches(s.margin_bottom_inches)
+        self._margin_left = Inches(s.margin_left_inches)
+        self._margin_right = Inches(s.margin_right_inches)
+        self._max_image_width = Inches(s.max_image_width_inches)
+
+        # Element type -> handler(doc, element); unknown types become paragraphs
+        self._dispatch = {
+            "paragraph": self._add_paragraph,
+            "p": self._add_paragraph,
+            "heading_1": partial(self._add_heading, level=1),
+            "h1": partial(self._add_heading, level=1),
+            "heading_2": partial(self._add_heading, level=2),
+            "h2": partial(self._add_heading, level=2),
+            "heading_3": partial(self._add_heading, level=3),
+            "h3": partial(self._add_heading, level=3),
+            "list_item": self._add_list_item,
+            "li": self._add_list_item,
+            "table": self._add_table,
+            "tbl": self._add_table,
+            "image": self._add_image,
+            "img": self._add_image,
+        }
 
-    async def generate(
+    def generate(
         self,
         structure,  # DocumentStructure from pdf_service
         output_dir: str,
@@ -87,9 +187,35 @@ class DOCXService:
         Returns:
             Path to the generated DOCX file
         """
-        # Create output directory if needed
+        # Create output directory if needed. Not cached: each job gets a fresh
+        # directory that delete_job later removes.
         os.makedirs(output_dir, exist_ok=True)
 
+        data = self.generate_to_bytes(structure, preserve_layout)
+
+        # Save the document in one write instead of the ZIP writer's many small ones
+        output_path = os.path.join(output_dir, filename)
+        fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view) :]
+        finally:
+            os.close(fd)
+
+        return output_path
+
+    def generate_to_bytes(self, structure, preserve_layout: bool = True) -> bytes:
+        """
+        Generate a DOCX document in memory.
+
+        Args:
+            structure: DocumentStructure with pages and elements
+            preserve_layout: Whether to try preserving original layout
+
+        Returns:
+            DOCX file content
+        """
         # Create document
         doc = Document()
 
@@ -103,34 +229,32 @@ class DOCXService:
                 doc.add_page_break()
 
             # Process elements on the page
-            await self._process_page(doc, page, preserve_layout)
+            self._process_page(doc, page, preserve_layout)
 
-        # Save the document
-        output_path = os.path.join(output_dir, filename)
-        doc.save(output_path)
-
-        return output_path
+        buffer = io.BytesIO()
+        doc.save(buffer)
+        return buffer.getvalue()
 
     def _setup_page_layout(self, doc: Document):
         """Configure page layout settings."""
         section = doc.sections[0]
 
         # Set page size
-        section.page_width = Inches(self.settings.page_width_inches)
-        section.page_height = Inches(self.settings.page_height_inches)
+        section.page_width = self._page_width
+        section.page_height = self._page_height
 
         # Set margins
-        section.top_margin = Inches(self.settings.margin_top_inches)
-        section.bottom_margin = Inches(self.settings.margin_bottom_inches)
-        section.left_margin = Inches(self.settings.margin_left_inches)
-        section.right_margin = Inches(self.settings.margin_right_inches)
+        section.top_margin = self._margin_top
+        section.bottom_margin = self._margin_bottom
+        section.left_margin = self._margin_left
+        section.right_margin = self._margin_right
 
-    async def _process_page(self, doc: Document, page, preserve_layout: bool):
+    def _process_page(self, doc: Document, page, preserve_layout: bool):
         """Process all elements on a page."""
         for element in page.elements:
-            await self._add_element(doc, element, page.width, page.height)
+            self._add_element(doc, element, page.width, page.height)
 
-    async def _add_element(
+    def _add_element(
         self,
         doc: Document,
         element,  # ExtractedElement
@@ -138,32 +262,9 @@ class DOCXService:
         page_height: float,
     ):
         """Add a single element to the document."""
-        element_type = element.type
-
-        if element_type in ("paragraph", "p"):
-            self._add_paragraph(doc, element)
-
-        elif element_type in ("heading_1", "h1"):
-            self._add_heading(doc, element, level=1)
-
-        elif element_type in ("heading_2", "h2"):
-            self._add_heading(doc, element, level=2)
-
-        elif element_type in ("heading_3", "h3"):
-            self._add_heading(doc, element, level=3)
-
-        elif element_type in ("list_item", "li"):
-            self._add_list_item(doc, element)
-
-        elif element_type in ("table", "tbl"):
-            self._add_table(doc, element)
-
-        elif element_type in ("image", "img"):
-            await self._add_image(doc, element)
-
-        else:
-            # Default: treat as paragraph
-            self._add_paragraph(doc, element)
+        # Default: treat as paragraph
+        handler = self._dispatch.get(element.type, self._add_paragraph)
+        handler(doc, element)
 
     def _add_paragraph(self, doc: Document, element):
         """Add a paragraph element."""
@@ -221,57 +322,47 @@ class DOCXService:
 
         # Determine table dimensions
         num_rows = len(table_data)
-        num_cols = max(len(row) for row in table_data) if table_data else 1
+        num_cols = max(map(len, table_data))
 
         # Create table
         table = doc.add_table(rows=num_rows, cols=num_cols)
         table.style = self.settings.table_style
 
-        # Populate cells
-        for row_idx, row_data in enumerate(table_data):
-            row = table.rows[row_idx]
-            for col_idx, cell_content in enumerate(row_data):
-                if col_idx < len(row.cells):
-                    cell = row.cells[col_idx]
-                    cell.text = str(cell_content) if cell_content else ""
-
-                    # Format cell text
-                    if cell.paragraphs:
-                        for para in cell.paragraphs:
-                            for run in para.runs:
-                                run.font.size = Pt(self.settings.default_font_size)
-                                run.font.name = self.settings.default_font_name
+        # Populate cells. Assigning cell.text leaves a single paragraph with a
+        # single run, so that run is the only one that needs formatting.
+        font_name = self.settings.default_font_name
+        font_size = self._pt_default
+        for row, row_data in zip(table.rows, table_data):
+            cells = row.cells  # computed from the grid on every access
+            for cell, cell_content in zip(cells, row_data):
+                cell.text = str(cell_content) if cell_content else ""
+
+                # Format cell text
+                runs = cell.paragraphs[0].runs
+                if runs:
+                    runs[0].font.size = font_size
+                    runs[0].font.name = font_name
 
         # Add some spacing after table
         doc.add_paragraph()
 
-    async def _add_image(self, doc: Document, element):
+    def _add_image(self, doc: Document, element):
         """Add an image element."""
-        # Check if image data is available
-        image_data = element.metadata.get("image_data") if element.metadata else None
-        image_base64 = (
-            element.metadata.get("image_base64") if element.metadata else None
-        )
+        meta = element.metadata or _EMPTY
 
-        if image_data:
+        if image_data := meta.get("image_data"):
             # Image data as bytes
             image_stream = io.BytesIO(image_data)
-            doc.add_picture(
-                image_stream, width=Inches(self.settings.max_image_width_inches)
-            )
-        elif image_base64:
+        elif image_base64 := meta.get("image_base64"):
             # Image as base64 string
-            import base64
-
-            image_bytes = base64.b64decode(image_base64)
-            image_stream = io.BytesIO(image_bytes)
-            doc.add_picture(
-                image_stream, width=Inches(self.settings.max_image_width_inches)
-            )
+            image_stream = io.BytesIO(base64.b64decode(image_base64))
         else:
             # Placeholder for image
             para = doc.add_paragraph("[IMAGE]")
             para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+            return
+
+        doc.add_picture(image_stream, width=self._max_image_width)
 
     def _apply_text_style(
         self,
@@ -289,20 +380,14 @@ class DOCXService:
         run.font.name = font_name
 
         # Set font for East Asian text as well
-        run._element.rPr.rFonts.set(qn("w:eastAsia"), font_name)
+        run._element.rPr.rFonts.set(_EAST_ASIA, font_name)
 
         # Font size
         if is_heading:
-            sizes = {
-                1: self.settings.heading_1_size,
-                2: self.settings.heading_2_size,
-                3: self.settings.heading_3_size,
-            }
-            font_size = sizes.get(level, self.settings.default_font_size)
+            run.font.size = self._heading_pt.get(level, self._pt_default)
         else:
-            font_size = style.get("font_size", self.settings.default_font_size)
-
-        run.font.size = Pt(font_size)
+            font_size = style.get("font_size")
+            run.font.size = Pt(font_size) if font_size is not None else self._pt_default
 
         # Bold
         if style.get("bold"):
@@ -319,49 +404,29 @@ class DOCXService:
         # Color
         color = style.get("color")
         if color and color.startswith("#"):
-            try:
-                # Parse hex color
-                hex_color = color.lstrip("#")
-                r = int(hex_color[0:2], 16)
-                g = int(hex_color[2:4], 16)
-                b = int(hex_color[4:6], 16)
-                run.font.color.rgb = RGBColor(r, g, b)
-            except (ValueError, IndexError):
-                pass  # Invalid color, skip
+            rgb = _hex_to_rgb(color)
+            if rgb is not None:
+                run.font.color.rgb = rgb
 
     def _get_alignment(self, alignment: str) -> WD_ALIGN_PARAGRAPH:
         """Convert alignment string to WD_ALIGN_PARAGRAPH enum."""
-        alignments = {
-            "left": WD_ALIGN_PARAGRAPH.LEFT,
-            "center": WD_ALIGN_PARAGRAPH.CENTER,
-            "right": WD_ALIGN_PARAGRAPH.RIGHT,
-            "justify": WD_ALIGN_PARAGRAPH.JUSTIFY,
-        }
-        return alignments.get(alignment.lower(), WD_ALIGN_PARAGRAPH.LEFT)
+        if not alignment:
+            return WD_ALIGN_PARAGRAPH.LEFT
+        return _ALIGNMENTS.get(alignment.lower(), WD_ALIGN_PARAGRAPH.LEFT)
 
     def _clean_list_content(self, content: str) -> str:
         """Remove bullet or number prefix from list item content."""
         content = content.strip()
 
         # Remove common bullet characters
-        bullets = ["•", "-", "*", "–", "◦", "○", "●", "■", "□"]
-        for bullet in bullets:
-            if content.startswith(bullet):
-                content = content[len(bullet) :].strip()
-                return content
+        # (every bullet is a single character)
+        if content.startswith(_BULLETS):
+            return content[1:].strip()
 
         # Remove number prefix (e.g., "1.", "1)", "a.", "a)")
-        import re
-
-        match = re.match(r"^[\d]+[.)]\s*", content)
-        if match:
-            content = content[match.end() :].strip()
-            return content
-
-        match = re.match(r"^[a-zA-Z][.)]\s*", content)
+        match = _NUM_PREFIX_RE.match(content) or _ALPHA_PREFIX_RE.match(content)
         if match:
-            content = content[match.end() :].strip()
-            return content
+            return content[match.end() :].strip()
 
         return content
 
@@ -399,12 +464,9 @@ class DOCXService:
                 para = doc.add_paragraph(para_text)
                 for run in para.runs:
                     run.font.name = self.settings.default_font_name
-                    run.font.size = Pt(self.settings.default_font_size)
-
-        # Ensure directory exists
-        os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+                    run.font.size = self._pt_default
 
-        doc.save(output_path)
+        _save_document(doc, output_path)
         return output_path
 
     def generate_from_html_table(
@@ -429,6 +491,7 @@ class DOCXService:
             def __init__(self):
                 super().__init__()
                 self.rows = []
+                self.num_cols = 0  # widest row, tracked while parsing
                 self.current_row = []
                 self.current_cell = ""
                 self.in_cell = False
@@ -447,6 +510,7 @@ class DOCXService:
                 elif tag == "tr":
                     if self.current_row:
                         self.rows.append(self.current_row)
+                        self.num_cols = max(self.num_cols, len(self.current_row))
 
             def handle_data(self, data):
                 if self.in_cell:
@@ -459,19 +523,13 @@ class DOCXService:
         self._setup_page_layout(doc)
 
         if parser.rows:
-            num_rows = len(parser.rows)
-            num_cols = max(len(row) for row in parser.rows)
-
-            table = doc.add_table(rows=num_rows, cols=num_cols)
+            table = doc.add_table(rows=len(parser.rows), cols=parser.num_cols)
             table.style = self.settings.table_style
 
-            for row_idx, row_data in enumerate(parser.rows):
-                row = table.rows[row_idx]
-                for col_idx, cell_content in enumerate(row_data):
-                    if col_idx < len(row.cells):
-                        row.cells[col_idx].text = cell_content
+            for row, row_data in zip(table.rows, parser.rows):
+                for cell, cell_content in zip(row.cells, row_data):
+                    cell.text = cell_content
 
-        os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
-        doc.save(output_path)
+        _save_document(doc, output_path)
 
         return output_path
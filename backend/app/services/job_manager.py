@@ -5,18 +5,69 @@ In-memory storage, essential operations only.
 
 import os
 import shutil
-from datetime import datetime, timedelta
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from itertools import islice
 from typing import Optional
 
 from app.config import settings
 from app.models.schemas import JobResponse, JobStatistics, JobStatus
+from app.services.storage import invalidate_stat_cache
+
+# Jobs in these states can no longer be cancelled
+_NON_CANCELLABLE = frozenset(
+    (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED)
+)
+
+# Statuses that set the job's completion time
+_TERMINAL = frozenset((JobStatus.COMPLETED, JobStatus.FAILED))
+
+# Fields update_job is allowed to change
+_UPDATABLE = frozenset(
+    (
+        "status",
+        "progress",
+        "message",
+        "pages_total",
+        "pages_processed",
+        "document_type",
+        "download_url",
+        "output_path",
+        "processing_time_ms",
+    )
+)
+
+_NS_PER_HOUR = 3600 * 10**9
+
+# Output file stats are reused across download/info/HEAD requests for a short
+# time; the cache is LRU with a size cap
+OUTPUT_STAT_TTL_NS = 60 * 10**9
+OUTPUT_STAT_CACHE_SIZE = 1024
+
+
+def _ns_to_datetime(ns: Optional[int]) -> Optional[datetime]:
+    """Convert an epoch-nanoseconds timestamp to an aware UTC datetime."""
+    return datetime.fromtimestamp(ns / 1e9, timezone.utc) if ns is not None else None
 
 
 class JobManager:
     """Simple job manager with in-memory storage."""
 
     def __init__(self):
+        # Insertion order == creation order, so reversed() iterates newest first
         self._jobs: dict[str, dict] = {}
+        # Secondary index: job IDs by current status
+        self._by_status: dict[JobStatus, set[str]] = {s: set() for s in JobStatus}
+        # job ID -> (output path, stat, monotonic ns), oldest first
+        self._output_stats: OrderedDict[str, tuple[str, os.stat_result, int]] = (
+            OrderedDict()
+        )
+        # Per-job file folders live under these
+        self._job_folders = tuple(
+            os.path.join(settings.storage_path, folder)
+            for folder in ("uploads", "output")
+        )
 
     async def create_job(
         self,
@@ -27,7 +78,8 @@ class JobManager:
         settings_data: dict,
     ) -> JobResponse:
         """Create a new job."""
-        now = datetime.utcnow()
+        output_dir = os.path.join(settings.storage_path, "output", job_id)
+        output_filename = os.path.splitext(filename)[0] + ".docx"
         job = {
             "job_id": job_id,
             "status": JobStatus.PENDING,
@@ -40,13 +92,17 @@ class JobManager:
             "pages_processed": 0,
             "document_type": None,
             "download_url": None,
-            "output_path": None,
-            "created_at": now,
-            "completed_at": None,
+            "output_dir": output_dir,
+            "output_filename": output_filename,
+            "output_path": os.path.join(output_dir, output_filename),
+            # Timestamps are kept as epoch nanoseconds; datetimes are built on output
+            "created_ns": time.time_ns(),
+            "completed_ns": None,
             "processing_time_ms": None,
             "settings": settings_data,
         }
         self._jobs[job_id] = job
+        self._by_status[JobStatus.PENDING].add(job_id)
         return self._to_response(job)
 
     async def get_job(self, job_id: str) -> Optional[JobResponse]:
@@ -64,16 +120,46 @@ class JobManager:
         if not job:
             return None
 
-        for key, value in kwargs.items():
-            if value is not None and key in job:
-                job[key] = value
+        # Cancelled jobs stay cancelled even if background processing reports in
+        if job["status"] == JobStatus.CANCELLED:
+            return self._to_response(job)
+
+        new_status = kwargs.get("status")
+        if new_status is not None and new_status != job["status"]:
+            self._move_status(job_id, job["status"], new_status)
+
+        job.update(
+            {k: v for k, v in kwargs.items() if v is not None and k in _UPDATABLE}
+        )
+        if kwargs.get("output_path") is not None:
+            self._output_stats.pop(job_id, None)
 
-        # Set completed_at for terminal states
-        if kwargs.get("status") in [JobStatus.COMPLETED, JobStatus.FAILED]:
-            job["completed_at"] = datetime.utcnow()
+        # Set completion time for terminal states
+        if new_status in _TERMINAL:
+            job["completed_ns"] = time.time_ns()
 
         return self._to_response(job)
 
+    async def cancel_job(self, job_id: str) -> tuple[Optional[JobResponse], bool]:
+        """
+        Cancel a pending or processing job.
+
+        Status check and update happen in one step. Returns the job
+        (None if not found) and whether it was cancelled.
+        """
+        job = self._jobs.get(job_id)
+        if not job:
+            return None, False
+
+        if job["status"] in _NON_CANCELLABLE:
+            return self._to_response(job), False
+
+        self._move_status(job_id, job["status"], JobStatus.CANCELLED)
+        job["status"] = JobStatus.CANCELLED
+        job["message"] = "Cancelled"
+        job["completed_ns"] = time.time_ns()
+        return self._to_response(job), True
+
     async def list_jobs(
         self,
         status: Optional[JobStatus] = None,
@@ -81,13 +167,12 @@ class JobManager:
         offset: int = 0,
     ) -> list[JobResponse]:
         """List jobs, newest first."""
-        jobs = list(self._jobs.values())
-
         if status:
-            jobs = [j for j in jobs if j["status"] == status]
-
-        jobs.sort(key=lambda j: j["created_at"], reverse=True)
-        jobs = jobs[offset : offset + limit]
+            jobs = [self._jobs[job_id] for job_id in self._by_status[status]]
+            jobs.sort(key=lambda j: j["created_ns"], reverse=True)
+            jobs = jobs[offset : offset + limit]
+        else:
+            jobs = list(islice(reversed(self._jobs.values()), offset, offset + limit))
 
         return [self._to_response(j) for j in jobs]
 
@@ -96,33 +181,88 @@ class JobManager:
         if job_id not in self._jobs:
             return False
 
-        # Clean up files
-        for folder in ["uploads", "output"]:
-            path = os.path.join(settings.storage_path, folder, job_id)
-            if os.path.exists(path):
-                shutil.rmtree(path, ignore_errors=True)
+        # Clean up files (rmtree ignores folders that don't exist)
+        for folder in self._job_folders:
+            job_folder = os.path.join(folder, job_id)
+            shutil.rmtree(job_folder, ignore_errors=True)
+            # Removed behind LocalStorage's back, so drop its cached stats
+            invalidate_stat_cache(job_folder)
 
-        del self._jobs[job_id]
+        job = self._jobs.pop(job_id)
+        self._by_status[job["status"]].discard(job_id)
+        self._output_stats.pop(job_id, None)
         return True
 
     async def cleanup_old_jobs(self, hours: int = 24) -> int:
-        """Delete completed/failed jobs older than X hours."""
-        cutoff = datetime.utcnow() - timedelta(hours=hours)
-        to_delete = []
-
-        for job_id, job in self._jobs.items():
-            if job["status"] in [JobStatus.COMPLETED, JobStatus.FAILED]:
-                if job["created_at"] < cutoff:
-                    to_delete.append(job_id)
+        """Delete completed/failed/cancelled jobs older than X hours."""
+        cutoff_ns = time.time_ns() - hours * _NS_PER_HOUR
+        to_delete = [
+            job_id
+            for status in _NON_CANCELLABLE
+            for job_id in self._by_status[status]
+            if self._jobs[job_id]["created_ns"] < cutoff_ns
+        ]
 
         for job_id in to_delete:
             await self.delete_job(job_id)
 
         return len(to_delete)
 
+    def get_output_stat(
+        self, job_id: str, fresh: bool = False
+    ) -> Optional[tuple[str, os.stat_result]]:
+        """
+        Locate a job's output file.
+
+        Returns (path, stat), or None if the job or its file is missing.
+        Results are cached briefly so repeated requests for the same job don't
+        stat the file again; fresh=True always re-stats (e.g. right before the
+        file is served).
+        """
+        now = time.monotonic_ns()
+        cache = self._output_stats
+        if not fresh:
+            cached = cache.get(job_id)
+            if cached and now - cached[2] < OUTPUT_STAT_TTL_NS:
+                cache.move_to_end(job_id)
+                return cached[0], cached[1]
+        cache.pop(job_id, None)
+
+        job = self._jobs.get(job_id)
+        output_path = job.get("output_path") if job else None
+        if not output_path:
+            return None
+
+        try:
+            file_stat = os.stat(output_path)
+        except OSError:
+            return None
+
+        cache[job_id] = (output_path, file_stat, now)
+        # Drop expired entries from the cold end, then enforce the size cap
+        while cache:
+            oldest_ns = next(iter(cache.values()))[2]
+            expired = now - oldest_ns >= OUTPUT_STAT_TTL_NS
+            if not expired and len(cache) <= OUTPUT_STAT_CACHE_SIZE:
+                break
+            cache.popitem(last=False)
+
+        return output_path, file_stat
+
+    def _move_status(
+        self, job_id: str, old_status: JobStatus, new_status: JobStatus
+    ) -> None:
+        """Keep the status index in sync with a status change."""
+        self._by_status[old_status].discard(job_id)
+        self._by_status[new_status].add(job_id)
+
     def _to_response(self, job: dict) -> JobResponse:
-        """Convert job dict to response model."""
-        return JobResponse(
+        """
+        Convert job dict to response model.
+
+        Job dicts are only written by this manager, so validation is skipped.
+        """
+        return JobResponse.model_construct(
             job_id=job["job_id"],
             status=job["status"],
             progress=job["progress"],
@@ -133,8 +273,8 @@ class JobManager:
             pages_processed=job.get("pages_processed", 0),
             document_type=job.get("document_type"),
             download_url=job.get("download_url"),
-            created_at=job["created_at"],
-            completed_at=job.get("completed_at"),
+            created_at=_ns_to_datetime(job["created_ns"]),
+            completed_at=_ns_to_datetime(job.get("completed_ns")),
             processing_time_ms=job.get("processing_time_ms"),
         )
 
@@ -0,0 +1,124 @@
+"""
+OCR result cache.
+Stores parsed OCR results in SQLite, keyed by image content and prompt setup,
+so re-processed pages skip the API call.
+"""
+
+import asyncio
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+import orjson
+
+# Entries older than this are ignored and pruned
+OCR_CACHE_TTL_SECONDS = 30 * 24 * 3600
+# Oldest entries beyond this count are pruned
+OCR_CACHE_MAX_ENTRIES = 50_000
+# Inserts between prunes; one also runs when the cache is first opened
+PRUNE_EVERY_INSERTS = 500
+
+
+def ocr_cache_key(image_bytes: bytes, *parts: str) -> str:
+    """Build a cache key from the image content plus model/prompt/language."""
+    return ":".join((hashlib.sha256(image_bytes).hexdigest(), *parts))
+
+
+class SQLiteOCRCache:
+    """
+    Small key -> dict store; blocking sqlite calls run in a worker thread.
+
+    Size is bounded: entries expire after ttl_seconds and only the newest
+    max_entries are kept, pruned when opened and every few hundred inserts.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_entries: int = OCR_CACHE_MAX_ENTRIES,
+        ttl_seconds: float = OCR_CACHE_TTL_SECONDS,
+    ):
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._inserts_since_prune = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS ocr_results "
+                "(key TEXT PRIMARY KEY, value BLOB NOT NULL, created REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS ocr_results_created "
+                "ON ocr_results (created)"
+            )
+            self._prune(conn)
+            self._conn = conn
+        return self._conn
+
+    def _prune(self, conn: sqlite3.Connection):
+        """Delete expired entries, then the oldest ones beyond max_entries."""
+        conn.execute(
+            "DELETE FROM ocr_results WHERE created < ?",
+            (time.time() - self.ttl_seconds,),
+        )
+        conn.execute(
+            "DELETE FROM ocr_results WHERE key IN "
+            "(SELECT key FROM ocr_results ORDER BY created DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,),
+        )
+        conn.commit()
+        self._inserts_since_prune = 0
+
+    def _lookup_sync(self, key: str) -> Optional[dict]:
+        with self._lock:
+            row = (
+                self._connect()
+                .execute(
+                    "SELECT value FROM ocr_results WHERE key = ? AND created >= ?",
+                    (key, time.time() - self.ttl_seconds),
+                )
+                .fetchone()
+            )
+        return orjson.loads(row[0]) if row else None
+
+    def _store_sync(self, key: str, value: dict):
+        data = orjson.dumps(value)
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO ocr_results (key, value, created) "
+                "VALUES (?, ?, ?)",
+                (key, data, time.time()),
+            )
+            conn.commit()
+            self._inserts_since_prune += 1
+            if self._inserts_since_prune >= PRUNE_EVERY_INSERTS:
+                self._prune(conn)
+
+    async def lookup(self, key: str) -> Optional[dict]:
+        """
+        Return the cached result for key, or None.
+
+        Best-effort: database errors (locked, read-only volume) count as a miss.
+        """
+        try:
+            return await asyncio.to_thread(self._lookup_sync, key)
+        except (sqlite3.Error, OSError):
+            return None
+
+    async def store(self, key: str, value: dict):
+        """Cache a result; database errors are ignored (best-effort)."""
+        try:
+            await asyncio.to_thread(self._store_sync, key, value)
+        except (sqlite3.Error, OSError):
+            pass
@@ -3,14 +3,22 @@ DeepSeek VL2 OCR Provider - Simplified.
 Cost-effective alternative to Mistral.
 """
 
+import asyncio
 import base64
-import json
+import os
+import random
 import time
 from typing import Optional
 
 import httpx
+import orjson
 
 from app.config import settings
+from app.services.ocr.cache import SQLiteOCRCache, ocr_cache_key
+from app.services.ocr.rate_limiter import AsyncRateLimiter
+
+# Bump when the prompt or message layout changes; invalidates cached results
+PROMPT_VERSION = "v1"
 
 SYSTEM_PROMPT = """Extract all text and structure from document images.
 
@@ -27,6 +35,17 @@ Output JSON format:
 
 bbox format: [y_min, x_min, y_max, x_max] in 0-1000 coordinates."""
 
+# Every request starts with this exact message, so the provider's prefix cache
+# can reuse it. Per-call text (language hint) and the image go after it.
+_SYSTEM_MESSAGE = {"role": "system", "content": SYSTEM_PROMPT}
+
+# Transient failures worth retrying with backoff
+RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+MAX_ATTEMPTS = 3
+MAX_BACKOFF_SECONDS = 30.0
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
 
 class DeepSeekOCR:
     """DeepSeek VL2 OCR - cost-effective and reliable."""
@@ -37,18 +56,34 @@ class DeepSeekOCR:
     def __init__(self, api_key: Optional[str] = None):
         self.api_key = api_key or settings.deepseek_api_key
         self.client: Optional[httpx.AsyncClient] = None
+        self._sem: Optional[asyncio.Semaphore] = None
+        self.limiter = AsyncRateLimiter(settings.deepseek_rps)
+        self.cache = SQLiteOCRCache(
+            os.path.join(settings.storage_path, "cache", "ocr.sqlite3")
+        )
 
     @property
     def name(self) -> str:
         return "DeepSeek VL2"
 
     async def initialize(self):
+        if self.client:
+            return
         if not self.api_key:
             raise ValueError("DeepSeek API key required")
+        concurrency = settings.deepseek_max_concurrency or 8
+        # Pool sized to the semaphore: requests never wait on the pool itself,
+        # and every in-flight request keeps its connection alive for the next
         self.client = httpx.AsyncClient(
             timeout=120.0,
             headers={"Authorization": f"Bearer {self.api_key}"},
+            limits=httpx.Limits(
+                max_connections=concurrency,
+                max_keepalive_connections=concurrency,
+                keepalive_expiry=60.0,
+            ),
         )
+        self._sem = asyncio.Semaphore(concurrency)
 
     async def process_image(self, image_bytes: bytes, language: str = "auto") -> dict:
         """Process single image, return structured content."""
@@ -56,30 +91,41 @@ class DeepSeekOCR:
             await self.initialize()
 
         start = time.time()
-        image_b64 = base64.b64encode(image_bytes).decode()
+
+        # Identical pages (re-uploads, duplicates) reuse the earlier result
+        cache_key = ocr_cache_key(image_bytes, self.MODEL, PROMPT_VERSION, language)
+        cached = await self.cache.lookup(cache_key)
+        if cached is not None:
+            cached["processing_time_ms"] = int((time.time() - start) * 1000)
+            cached["provider"] = self.name
+            return cached
 
         # Detect image type
         mime = "image/jpeg"
         if image_bytes[:8] == b"\x89PNG\r\n\x1a\n":
             mime = "image/png"
 
+        # Encoded after the cache lookup so hits skip it; base64 is pure ASCII
+        image_b64 = base64.b64encode(image_bytes).decode("ascii")
+        image_url = f"data:{mime};base64,{image_b64}"
+
         prompt = "Extract all text and structure from this document."
         if language != "auto":
             prompt += f" Document language: {language}."
 
-        response = await self.client.post(
-            self.API_URL,
-            json={
+        response = await self._post_with_retry(
+            {
                 "model": self.MODEL,
                 "messages": [
-                    {"role": "system", "content": SYSTEM_PROMPT},
+                    _SYSTEM_MESSAGE,
                     {
                         "role": "user",
                         "content": [
                             {"type": "text", "text": prompt},
+                            # Image stays last: it never matches a cached prefix
                             {
                                 "type": "image_url",
-                                "image_url": {"url": f"data:{mime};base64,{image_b64}"},
+                                "image_url": {"url": image_url},
                             },
                         ],
                     },
@@ -87,26 +133,59 @@ class DeepSeekOCR:
                 "max_tokens": 8192,
                 "temperature": 0.1,
                 "response_format": {"type": "json_object"},
-            },
+            }
         )
-        response.raise_for_status()
 
-        content = response.json()["choices"][0]["message"]["content"]
+        content = orjson.loads(response.content)["choices"][0]["message"]["content"]
         parsed = self._parse(content)
+        if "error" not in parsed:
+            await self.cache.store(cache_key, parsed)
         parsed["processing_time_ms"] = int((time.time() - start) * 1000)
         parsed["provider"] = self.name
 
         return parsed
 
+    async def _post_with_retry(self, payload: dict) -> httpx.Response:
+        """POST to the API, retrying throttling/server errors with backoff."""
+        body = orjson.dumps(payload)
+        for attempt in range(MAX_ATTEMPTS):
+            await self.limiter.acquire()
+            retry_after = None
+            try:
+                response = await self.client.post(
+                    self.API_URL, content=body, headers=_JSON_HEADERS
+                )
+                response.raise_for_status()
+                return response
+            except httpx.HTTPStatusError as e:
+                if (
+                    e.response.status_code not in RETRY_STATUSES
+                    or attempt == MAX_ATTEMPTS - 1
+                ):
+                    raise
+                retry_after = e.response.headers.get("Retry-After")
+            except httpx.TransportError:
+                if attempt == MAX_ATTEMPTS - 1:
+                    raise
+
+            try:
+                delay = float(retry_after)
+            except (TypeError, ValueError):
+                delay = 2**attempt + random.random()
+            await asyncio.sleep(min(delay, MAX_BACKOFF_SECONDS))
+
     async def process_batch(
         self, images: list[bytes], language: str = "auto"
     ) -> list[dict]:
-        """Process multiple images."""
-        results = []
-        for img in images:
-            result = await self.process_image(img, language)
-            results.append(result)
-        return results
+        """Process multiple images concurrently, preserving order."""
+        if not self.client:
+            await self.initialize()
+        return await asyncio.gather(*(self._one(img, language) for img in images))
+
+    async def _one(self, image_bytes: bytes, language: str) -> dict:
+        """Process one image within the concurrency limit."""
+        async with self._sem:
+            return await self.process_image(image_bytes, language)
 
     def _parse(self, content: str) -> dict:
         """Parse JSON response."""
@@ -117,8 +196,8 @@ class DeepSeekOCR:
                 content = content[4:]
 
         try:
-            data = json.loads(content)
-        except json.JSONDecodeError:
+            data = orjson.loads(content)
+        except orjson.JSONDecodeError:
             return {"elements": [], "language": None, "error": "Parse error"}
 
         return {
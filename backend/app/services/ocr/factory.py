@@ -1,10 +1,17 @@
 """OCR Provider Factory - simplified."""
 
+from functools import lru_cache
+
 from app.config import settings
 
 
 def get_ocr_provider(provider_type: str = "auto"):
-    """Get OCR provider by type. Simple and direct."""
+    """
+    Get OCR provider by type. Simple and direct.
+
+    Providers are cached, so their HTTP client is created once and reused
+    across jobs (initialize() is a no-op after the first call).
+    """
 
     # Auto-select based on available API keys
     if provider_type == "auto":
@@ -14,7 +21,17 @@ def get_ocr_provider(provider_type: str = "auto"):
             provider_type = "deepseek"
         else:
             provider_type = "surya"
+    elif provider_type not in ("mistral", "deepseek"):
+        provider_type = "surya"
+
+    # Resolved before the cache lookup: "auto" and its concrete name must share
+    # one instance, or each would get its own rate limiter and semaphore
+    return _get_provider(provider_type)
+
 
+@lru_cache(maxsize=None)
+def _get_provider(provider_type: str):
+    """Create the provider for a resolved type (cached, one per type)."""
     # Import and return the right provider
     if provider_type == "mistral":
         from app.services.ocr.mistral import MistralOCR
@@ -44,6 +44,8 @@ class MistralOCR:
         return "Mistral Pixtral"
 
     async def initialize(self):
+        if self.client:
+            return
         if not self.api_key:
             raise ValueError("Mistral API key required")
         self.client = httpx.AsyncClient(
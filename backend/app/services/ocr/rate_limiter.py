@@ -0,0 +1,30 @@
+"""
+Async rate limiter for OCR API calls.
+Spaces requests evenly so batches stay under the provider's rate limit.
+"""
+
+import asyncio
+
+
+class AsyncRateLimiter:
+    """Allow at most `rps` acquisitions per second (0 disables limiting)."""
+
+    def __init__(self, rps: float):
+        self._interval = 1.0 / rps if rps > 0 else 0.0
+        self._next_time = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait for the next free request slot."""
+        if not self._interval:
+            return
+
+        # Reserve a slot under the lock, then sleep outside it
+        async with self._lock:
+            now = asyncio.get_running_loop().time()
+            slot = max(now, self._next_time)
+            self._next_time = slot + self._interval
+
+        wait = slot - now
+        if wait > 0:
+            await asyncio.sleep(wait)
@@ -8,14 +8,30 @@ This service is responsible for:
 - Detecting tables, images, and other elements
 """
 
+import asyncio
 import io
 import os
+import re
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Callable, Optional
 
 import fitz  # PyMuPDF
 
+from app.services.process_pool import map_in_pool, run_in_pool
+
+# Script ranges used by _detect_language (counted by the regex engine, in C)
+_CYRILLIC_RE = re.compile("[\u0400-\u04ff]")
+_CJK_RE = re.compile("[\u4e00-\u9fff]")
+_ARABIC_RE = re.compile("[\u0600-\u06ff]")
+
+# PyMuPDF span flag bits
+FLAG_ITALIC = 1 << 1
+FLAG_BOLD = 1 << 4
+
+# Bullet or "1." / "12)" style prefix of a list item line
+_LIST_ITEM_RE = re.compile(r"[•\-*–◦]|\d{1,3}[.)]")
+
 
 class DocumentType(str, Enum):
     """Type of PDF document based on content analysis."""
@@ -25,7 +41,7 @@ class DocumentType(str, Enum):
     MIXED = "mixed"  # Contains both text and image pages
 
 
-@dataclass
+@dataclass(slots=True)
 class PageInfo:
     """Information about a single PDF page."""
 
@@ -40,7 +56,7 @@ class PageInfo:
     rotation: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class PDFAnalysis:
     """Results of PDF document analysis."""
 
@@ -62,7 +78,7 @@ class PDFAnalysis:
         return self.pages_needing_ocr / self.total_pages
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractedElement:
     """A single extracted element from a PDF page."""
 
@@ -76,7 +92,7 @@ class ExtractedElement:
     metadata: dict = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class PageStructure:
     """Structured content of a single page."""
 
@@ -88,7 +104,7 @@ class PageStructure:
     image_base64: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DocumentStructure:
     """Complete document structure with all pages."""
 
@@ -99,6 +115,39 @@ class DocumentStructure:
     metadata: dict = field(default_factory=dict)
 
 
+# Page inspection and rendering for larger documents are split across the
+# shared worker processes, each opening its own handle (fitz documents can't
+# be shared between threads)
+PARALLEL_ANALYZE_MIN_PAGES = 32
+PARALLEL_RENDER_MIN_PAGES = 4
+# OCR pages are rendered and sent to the provider in small batches, so the
+# first requests start while later pages are still rendering
+RENDER_BATCH_PAGES = 2
+# Batches awaiting the OCR provider at once; providers with their own limit
+# (DeepSeek's semaphore) apply it within these
+OCR_BATCHES_IN_FLIGHT = 4
+
+
+def count_pages(file_path: str) -> int:
+    """Open a PDF and return its page count (runs in the process pool)."""
+    with fitz.open(file_path) as doc:
+        return len(doc)
+
+
+def _inspect_page_range(file_path: str, start: int, stop: int) -> list["PageInfo"]:
+    """Inspect pages [start, stop) of a PDF (runs in the process pool)."""
+    service = PDFService()
+    with fitz.open(file_path) as doc:
+        return [service._inspect_page(doc[i], i) for i in range(start, stop)]
+
+
+def _render_page_list(file_path: str, page_indices: list[int], dpi: int) -> list[bytes]:
+    """Render the given 0-based pages to JPEG (runs in the process pool)."""
+    service = PDFService()
+    with fitz.open(file_path) as doc:
+        return [service._page_to_image(doc[i], dpi) for i in page_indices]
+
+
 class PDFService:
     """
     Service for PDF document analysis and content extraction.
@@ -114,6 +163,12 @@ class PDFService:
     DEFAULT_IMAGE_DPI = 200
     HIGH_QUALITY_DPI = 300
 
+    # JPEG quality for rendered pages; plenty for OCR, much smaller than 95
+    JPEG_QUALITY = 85
+
+    # Characters of document text used for language detection
+    LANGUAGE_SAMPLE_CHARS = 1000
+
     def __init__(self):
         """Initialize PDF service."""
         pass
@@ -128,6 +183,17 @@ class PDFService:
         Returns:
             PDFAnalysis with document information
         """
+        # PyMuPDF work is blocking; keep it off the event loop
+        doc, analysis = await asyncio.to_thread(self._open_and_analyze, file_path)
+        doc.close()
+        return analysis
+
+    def _open_and_analyze(self, file_path: str) -> tuple[fitz.Document, PDFAnalysis]:
+        """
+        Open and analyze a PDF, returning the still-open document.
+
+        Blocking; the caller is responsible for closing the document.
+        """
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"PDF file not found: {file_path}")
 
@@ -137,52 +203,31 @@ class PDFService:
         doc = fitz.open(file_path)
 
         try:
-            pages_info: list[PageInfo] = []
-            pages_with_text = 0
-            pages_needing_ocr = 0
-            total_images = 0
-
-            for page_num in range(len(doc)):
-                page = doc[page_num]
-
-                # Extract text
-                text = page.get_text("text").strip()
-                char_count = len(text)
-
-                # Count images on the page
-                image_list = page.get_images(full=True)
-                image_count = len(image_list)
-                total_images += image_count
-
-                # Determine if page has extractable text
-                has_text = char_count >= self.MIN_CHARS_FOR_TEXT_PAGE
-
-                # Page needs OCR if it has images but little/no text
-                # or if it appears to be a scanned page
-                needs_ocr = not has_text and (
-                    image_count > 0 or self._is_scanned_page(page)
-                )
+            total_pages = len(doc)
 
-                if has_text:
-                    pages_with_text += 1
-                if needs_ocr:
-                    pages_needing_ocr += 1
-
-                page_info = PageInfo(
-                    page_number=page_num + 1,
-                    width=page.rect.width,
-                    height=page.rect.height,
-                    has_text=has_text,
-                    text_content=text if has_text else "",
-                    char_count=char_count,
-                    image_count=image_count,
-                    needs_ocr=needs_ocr,
-                    rotation=page.rotation,
+            if total_pages >= PARALLEL_ANALYZE_MIN_PAGES:
+                # One contiguous page range per worker
+                workers = os.cpu_count() or 1
+                step = -(-total_pages // workers)
+                starts = range(0, total_pages, step)
+                chunks = map_in_pool(
+                    _inspect_page_range,
+                    [file_path] * len(starts),
+                    starts,
+                    [min(start + step, total_pages) for start in starts],
                 )
-                pages_info.append(page_info)
+                pages_info = [info for chunk in chunks for info in chunk]
+            else:
+                pages_info = [
+                    self._inspect_page(doc[page_num], page_num)
+                    for page_num in range(total_pages)
+                ]
+
+            pages_with_text = sum(p.has_text for p in pages_info)
+            pages_needing_ocr = sum(p.needs_ocr for p in pages_info)
+            total_images = sum(p.image_count for p in pages_info)
 
             # Determine document type
-            total_pages = len(doc)
             if pages_needing_ocr == 0:
                 doc_type = DocumentType.NATIVE
             elif pages_needing_ocr == total_pages:
@@ -193,7 +238,7 @@ class PDFService:
             # Extract metadata
             metadata = dict(doc.metadata) if doc.metadata else {}
 
-            return PDFAnalysis(
+            analysis = PDFAnalysis(
                 total_pages=total_pages,
                 document_type=doc_type,
                 needs_ocr=pages_needing_ocr > 0,
@@ -205,16 +250,51 @@ class PDFService:
                 pages=pages_info,
             )
 
-        finally:
+        except BaseException:
             doc.close()
+            raise
+
+        return doc, analysis
+
+    def _inspect_page(self, page: fitz.Page, page_num: int) -> PageInfo:
+        """Collect text/image information for one page (0-based page_num)."""
+        # Extract text
+        text = page.get_text("text").strip()
+        char_count = len(text)
+
+        # Count images on the page
+        image_list = page.get_images(full=True)
+        image_count = len(image_list)
 
-    def _is_scanned_page(self, page: fitz.Page) -> bool:
+        # Determine if page has extractable text
+        has_text = char_count >= self.MIN_CHARS_FOR_TEXT_PAGE
+
+        # Page needs OCR if it has images but little/no text
+        # or if it appears to be a scanned page
+        needs_ocr = not has_text and (
+            image_count > 0 or self._is_scanned_page(page, image_list)
+        )
+
+        return PageInfo(
+            page_number=page_num + 1,
+            width=page.rect.width,
+            height=page.rect.height,
+            has_text=has_text,
+            text_content=text if has_text else "",
+            char_count=char_count,
+            image_count=image_count,
+            needs_ocr=needs_ocr,
+            rotation=page.rotation,
+        )
+
+    def _is_scanned_page(self, page: fitz.Page, images: list) -> bool:
         """
         Detect if a page appears to be a scanned document.
 
         Scanned pages typically have one large image covering most of the page.
+        images is the page's get_images(full=True) list, already fetched by
+        the caller.
         """
-        images = page.get_images(full=True)
         if not images:
             return False
 
@@ -258,44 +338,103 @@ class PDFService:
         Returns:
             DocumentStructure with all pages and elements
         """
-        # First analyze the document
-        analysis = await self.analyze(file_path)
+        # First analyze the document, keeping it open for extraction. Blocking
+        # PyMuPDF work runs in worker threads (one at a time: the document is
+        # not thread-safe) so OCR requests and other jobs aren't stalled.
+        doc, analysis = await asyncio.to_thread(self._open_and_analyze, file_path)
+
+        loop = asyncio.get_running_loop()
+        num_pages = len(doc)
+        pages_done = 0
+
+        def page_done(page_number: int):
+            # Native and OCR pages share one counter, so progress only moves up.
+            # Always called on the event loop.
+            nonlocal pages_done
+            pages_done += 1
+            if on_progress:
+                on_progress(int(pages_done * 100 / num_pages), page_number)
 
-        doc = fitz.open(file_path)
-        pages_structure: list[PageStructure] = []
+        def native_page_done(page_number: int):
+            loop.call_soon_threadsafe(page_done, page_number)
 
-        try:
-            for page_num in range(len(doc)):
-                page = doc[page_num]
-                page_info = analysis.pages[page_num]
-
-                # Report progress
-                if on_progress:
-                    progress = int((page_num / len(doc)) * 100)
-                    on_progress(progress, page_num + 1)
-
-                if page_info.needs_ocr and ocr_provider:
-                    # Convert page to image and run OCR
-                    page_structure = await self._extract_with_ocr(
-                        page, page_num + 1, ocr_provider, language
-                    )
-                else:
-                    # Extract text directly from PDF
-                    page_structure = self._extract_native(
-                        page, page_num + 1, extract_tables, extract_images
-                    )
+        pages_structure: list[Optional[PageStructure]] = [None] * num_pages
+        ocr_indices = (
+            [p.page_number - 1 for p in analysis.pages if p.needs_ocr]
+            if ocr_provider
+            else []
+        )
+        ocr_slots = asyncio.Semaphore(OCR_BATCHES_IN_FLIGHT)
 
-                pages_structure.append(page_structure)
+        async def ocr_batch(batch_indices: list[int]):
+            """Render a batch of pages in the worker pool, then OCR it."""
+            images = await run_in_pool(
+                _render_page_list, file_path, batch_indices, self.DEFAULT_IMAGE_DPI
+            )
+            async with ocr_slots:
+                results = await ocr_provider.process_batch(images, language)
+            if len(results) != len(batch_indices):
+                raise RuntimeError(
+                    f"OCR provider returned {len(results)} results for "
+                    f"{len(batch_indices)} pages"
+                )
+            for page_index, ocr_result in zip(batch_indices, results):
+                pages_structure[page_index] = self._ocr_page_structure(
+                    analysis.pages[page_index], ocr_result
+                )
+                page_done(page_index + 1)
+
+        # Each batch goes to OCR as soon as it is rendered, while later batches
+        # are still rendering and native pages are extracted in a thread
+        ocr_tasks = [
+            asyncio.ensure_future(
+                ocr_batch(ocr_indices[start : start + RENDER_BATCH_PAGES])
+            )
+            for start in range(0, len(ocr_indices), RENDER_BATCH_PAGES)
+        ]
+
+        native = loop.run_in_executor(
+            None,
+            self._extract_native_pages,
+            doc,
+            analysis.pages,
+            pages_structure,
+            set(ocr_indices),
+            extract_tables,
+            extract_images,
+            native_page_done,
+        )
+
+        try:
+            try:
+                # Shielded: a cancelled job must not stop waiting while the
+                # thread is still using doc (see finally)
+                await asyncio.shield(native)
+                await asyncio.gather(*ocr_tasks)
+            except BaseException:
+                for task in ocr_tasks:
+                    task.cancel()
+                await asyncio.gather(*ocr_tasks, return_exceptions=True)
+                raise
 
             # Final progress update
             if on_progress:
-                on_progress(100, len(doc))
+                on_progress(100, num_pages)
 
             # Detect language from extracted text if needed
             detected_language = None
             if language == "auto":
-                all_text = " ".join(p.raw_text for p in pages_structure if p.raw_text)
-                detected_language = self._detect_language(all_text)
+                # Only the first LANGUAGE_SAMPLE_CHARS are looked at, so stop
+                # collecting page text once there is enough
+                sample: list[str] = []
+                remaining = self.LANGUAGE_SAMPLE_CHARS
+                for p in pages_structure:
+                    if p.raw_text:
+                        sample.append(p.raw_text[:remaining])
+                        remaining -= len(sample[-1]) + 1  # + joining space
+                        if remaining <= 0:
+                            break
+                detected_language = self._detect_language(" ".join(sample))
             else:
                 detected_language = language
 
@@ -308,7 +447,47 @@ class PDFService:
             )
 
         finally:
-            doc.close()
+            if native.done():
+                doc.close()
+            else:
+                # Cancelled mid-extraction: closing doc under the running thread
+                # could crash MuPDF, so close it once the thread has finished
+                def close_doc(fut: asyncio.Future):
+                    if not fut.cancelled():
+                        fut.exception()  # Job already failed; just retrieve it
+                    doc.close()
+
+                native.add_done_callback(close_doc)
+
+    def _extract_native_pages(
+        self,
+        doc: fitz.Document,
+        pages_info: list[PageInfo],
+        pages_structure: list[Optional[PageStructure]],
+        skip: set[int],
+        extract_tables: bool,
+        extract_images: bool,
+        on_page_done: Callable[[int], None],
+    ):
+        """
+        Extract every page not in skip into pages_structure (blocking).
+
+        on_page_done is called with the page number after each page.
+        """
+        for page_num in range(len(doc)):
+            if page_num in skip:
+                continue
+
+            # Extract text directly from PDF
+            pages_structure[page_num] = self._extract_native(
+                doc[page_num],
+                page_num + 1,
+                extract_tables,
+                extract_images,
+                # Text pages already had their text read during analysis
+                preextracted_text=pages_info[page_num].text_content or None,
+            )
+            on_page_done(page_num + 1)
 
     def _extract_native(
         self,
@@ -316,13 +495,20 @@ class PDFService:
         page_number: int,
         extract_tables: bool = True,
         extract_images: bool = True,
+        preextracted_text: Optional[str] = None,
     ) -> PageStructure:
         """
         Extract content from a native (text-based) PDF page.
+
+        preextracted_text, if given, is used as the page's raw text instead of
+        extracting it again.
         """
         elements: list[ExtractedElement] = []
         page_width = page.rect.width
         page_height = page.rect.height
+        # Per-page scale to the 0-1000 space, used for every text line below
+        x_scale = 1000 / page_width
+        y_scale = 1000 / page_height
 
         # Get text blocks with positions
         blocks = page.get_text("dict", flags=fitz.TEXT_PRESERVE_WHITESPACE)["blocks"]
@@ -331,17 +517,19 @@ class PDFService:
         for block in blocks:
             if block["type"] == 0:  # Text block
                 for line in block.get("lines", []):
-                    text = ""
+                    spans = line.get("spans", [])
+                    text = "".join(span.get("text", "") for span in spans)
+
+                    # Style comes from the line's last span
                     font_size = 11
                     is_bold = False
                     is_italic = False
-
-                    for span in line.get("spans", []):
-                        text += span.get("text", "")
-                        font_size = span.get("size", 11)
-                        font_name = span.get("font", "").lower()
-                        is_bold = "bold" in font_name or span.get("flags", 0) & 2**4
-                        is_italic = "italic" in font_name or span.get("flags", 0) & 2**1
+                    if spans:
+                        last_span = spans[-1]
+                        font_size = last_span.get("size", 11)
+                        flags = last_span.get("flags", 0)
+                        is_bold = bool(flags & FLAG_BOLD)
+                        is_italic = bool(flags & FLAG_ITALIC)
 
                     text = text.strip()
                     if not text:
@@ -351,9 +539,12 @@ class PDFService:
                     element_type = self._classify_text_element(text, font_size, is_bold)
 
                     # Get bounding box and normalize to 0-1000
-                    bbox = line.get("bbox", block.get("bbox", (0, 0, 0, 0)))
-                    normalized_bbox = self._normalize_bbox(
-                        bbox, page_width, page_height
+                    x0, y0, x1, y1 = line.get("bbox", block.get("bbox", (0, 0, 0, 0)))
+                    normalized_bbox = (
+                        int(x0 * x_scale),
+                        int(y0 * y_scale),
+                        int(x1 * x_scale),
+                        int(y1 * y_scale),
                     )
 
                     element = ExtractedElement(
@@ -405,31 +596,28 @@ class PDFService:
             width=page_width,
             height=page_height,
             elements=elements,
-            raw_text=page.get_text("text"),
+            raw_text=(
+                preextracted_text
+                if preextracted_text is not None
+                else page.get_text("text")
+            ),
         )
 
-    async def _extract_with_ocr(
+    def _ocr_page_structure(
         self,
-        page: fitz.Page,
-        page_number: int,
-        ocr_provider,
-        language: str,
+        page_info: PageInfo,
+        ocr_result: dict,
     ) -> PageStructure:
         """
-        Extract content from a scanned page using OCR.
-        """
-        # Render page to image
-        image_bytes = self._page_to_image(page, dpi=self.DEFAULT_IMAGE_DPI)
-
-        # Run OCR
-        ocr_result = await ocr_provider.process_image(
-            image_bytes=image_bytes,
-            language=language,
-        )
+        Build a page structure from an OCR provider result.
 
+        Page dimensions come from the analysis, so the open document isn't
+        touched while native pages are extracted in another thread.
+        """
+        page_number = page_info.page_number
         # Convert OCR results to elements
         elements: list[ExtractedElement] = []
-        for idx, item in enumerate(ocr_result.elements):
+        for idx, item in enumerate(ocr_result.get("elements", [])):
             element = ExtractedElement(
                 id=f"p{page_number}_e{idx}",
                 type=item.get("type", "paragraph"),
@@ -446,8 +634,8 @@ class PDFService:
 
         return PageStructure(
             page_number=page_number,
-            width=page.rect.width,
-            height=page.rect.height,
+            width=page_info.width,
+            height=page_info.height,
             elements=elements,
             raw_text=" ".join(e.content for e in elements),
         )
@@ -456,10 +644,11 @@ class PDFService:
         """Convert a PDF page to a JPEG image."""
         zoom = dpi / 72  # 72 is the default PDF DPI
         mat = fitz.Matrix(zoom, zoom)
-        pix = page.get_pixmap(matrix=mat)
+        # No alpha channel: JPEG can't use it and it adds a byte per pixel
+        pix = page.get_pixmap(matrix=mat, alpha=False)
 
         # Convert to JPEG bytes
-        img_bytes = pix.tobytes("jpeg", 95)
+        img_bytes = pix.tobytes("jpeg", jpg_quality=self.JPEG_QUALITY)
         return img_bytes
 
     def _normalize_bbox(
@@ -483,7 +672,7 @@ class PDFService:
         font_size: float,
         is_bold: bool,
     ) -> str:
-        """Classify a text element based on its properties."""
+        """Classify a text element (already stripped) based on its properties."""
         # Simple heuristic-based classification
         if font_size >= 18 and is_bold:
             return "heading_1"
@@ -491,9 +680,7 @@ class PDFService:
             return "heading_2"
         elif font_size >= 12 and is_bold:
             return "heading_3"
-        elif text.strip().startswith(("•", "-", "*", "–", "◦")):
-            return "list_item"
-        elif text.strip()[0:3].replace(".", "").replace(")", "").isdigit():
+        elif _LIST_ITEM_RE.match(text):
             return "list_item"
         else:
             return "paragraph"
@@ -562,17 +749,17 @@ class PDFService:
         if not text or len(text) < 20:
             return "en"
 
-        # Simple detection based on character ranges
-        sample = text[:1000].lower()
+        # Simple detection based on character ranges (case doesn't change them)
+        sample = text[: self.LANGUAGE_SAMPLE_CHARS]
 
         # Count Cyrillic characters (Russian, Ukrainian, etc.)
-        cyrillic_count = sum(1 for c in sample if "\u0400" <= c <= "\u04ff")
+        cyrillic_count = len(_CYRILLIC_RE.findall(sample))
 
         # Count CJK characters (Chinese, Japanese, Korean)
-        cjk_count = sum(1 for c in sample if "\u4e00" <= c <= "\u9fff")
+        cjk_count = len(_CJK_RE.findall(sample))
 
         # Count Arabic characters
-        arabic_count = sum(1 for c in sample if "\u0600" <= c <= "\u06ff")
+        arabic_count = len(_ARABIC_RE.findall(sample))
 
         total_chars = len(sample)
 
@@ -629,17 +816,37 @@ class PDFService:
         Returns:
             List of JPEG image bytes for each page
         """
-        doc = fitz.open(file_path)
-        images = []
-
-        try:
+        with fitz.open(file_path) as doc:
             num_pages = min(len(doc), max_pages) if max_pages else len(doc)
 
-            for page_num in range(num_pages):
-                page = doc[page_num]
-                img_bytes = self._page_to_image(page, dpi)
-                images.append(img_bytes)
+        return self._render_pages(file_path, list(range(num_pages)), dpi)
 
-            return images
-        finally:
-            doc.close()
+    def _render_pages(
+        self,
+        file_path: str,
+        page_indices: list[int],
+        dpi: int,
+    ) -> list[bytes]:
+        """
+        Render pages (0-based indices) to JPEG, in input order.
+
+        Several pages are split across the worker pool; a few are rendered here.
+        """
+        if len(page_indices) < PARALLEL_RENDER_MIN_PAGES:
+            with fitz.open(file_path) as doc:
+                return [self._page_to_image(doc[i], dpi) for i in page_indices]
+
+        # Interleave pages so each worker gets a similar mix of pages
+        workers = min(os.cpu_count() or 1, len(page_indices))
+        groups = [page_indices[w::workers] for w in range(workers)]
+        results = map_in_pool(
+            _render_page_list,
+            [file_path] * workers,
+            groups,
+            [dpi] * workers,
+        )
+
+        images: list[bytes] = [b""] * len(page_indices)
+        for w, group_images in enumerate(results):
+            images[w::workers] = group_images
+        return images
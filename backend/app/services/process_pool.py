@@ -0,0 +1,83 @@
+"""
+Shared worker-process pool for blocking PyMuPDF work.
+
+One pool serves the whole app (upload page counts, page inspection and page
+rendering). Workers are started with forkserver (spawn where unavailable):
+forking the threaded server could copy held locks into the children.
+
+A worker that crashes breaks the whole pool, so callers go through
+run_in_pool / map_in_pool, which replace a broken pool and retry once.
+"""
+
+import asyncio
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Iterable, Optional
+
+_START_METHOD = (
+    "forkserver"
+    if "forkserver" in multiprocessing.get_all_start_methods()
+    else "spawn"
+)
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> ProcessPoolExecutor:
+    """Return the shared pool, creating it on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count(),
+                mp_context=multiprocessing.get_context(_START_METHOD),
+            )
+        return _pool
+
+
+def _discard(pool: ProcessPoolExecutor):
+    """Drop a broken pool so the next get_pool() starts a fresh one."""
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def run_in_pool(func: Callable[..., Any], *args) -> Any:
+    """
+    Run func(*args) in a worker process.
+
+    If the pool is broken (a worker died), it is replaced and the call is
+    retried once; a second failure raises BrokenProcessPool.
+    """
+    loop = asyncio.get_running_loop()
+    for attempt in range(2):
+        pool = get_pool()
+        try:
+            return await loop.run_in_executor(pool, func, *args)
+        except BrokenProcessPool:
+            _discard(pool)
+            if attempt:
+                raise
+
+
+def map_in_pool(func: Callable[..., Any], *iterables: Iterable) -> list:
+    """
+    Blocking equivalent of list(pool.map(func, *iterables)).
+
+    Broken pools are handled as in run_in_pool.
+    """
+    args = [list(it) for it in iterables]
+    for attempt in range(2):
+        pool = get_pool()
+        try:
+            return list(pool.map(func, *args))
+        except BrokenProcessPool:
+            _discard(pool)
+            if attempt:
+                raise
@@ -11,16 +11,236 @@ Features:
 - Clean up old files
 """
 
+import asyncio
+import errno
+import hashlib
+import mmap
 import os
 import shutil
+import stat
+import tempfile
+import threading
+import time
 from abc import ABC, abstractmethod
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import BinaryIO, Optional
+from typing import BinaryIO, Callable, Optional
 from urllib.parse import urljoin
 
+import httpx
+
 from app.config import settings
 
+# Directories with more files than this are deleted with parallel unlinks;
+# smaller ones use a single rmtree
+PARALLEL_DELETE_MIN_FILES = 64
+_unlink_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="unlink")
+
+
+@lru_cache(maxsize=4096)
+def _safe_join(base: Path, path: str) -> Path:
+    """
+    Join a storage path onto the base directory.
+
+    Pure string work on immutable Paths, so results are cached: job files are
+    looked up by the same keys several times (upload, exists, download).
+    """
+    # Prevent path traversal attacks
+    safe_path = Path(path).as_posix().lstrip("/")
+    return base / safe_path
+
+
+# exists() results are kept this long (seconds) so an immediately following
+# get_file_info() reuses the stat instead of repeating it
+STAT_CACHE_TTL = 0.5
+STAT_CACHE_MAX_ENTRIES = 1024
+# Full path -> (monotonic time, stat result); only touched from the event loop
+_stat_cache: dict[str, tuple[float, os.stat_result]] = {}
+
+
+def invalidate_stat_cache(path: str | Path, tree: bool = True):
+    """
+    Drop cached LocalStorage stats for a filesystem path.
+
+    With tree=True, everything below the path is dropped too. Code that
+    removes storage files without going through LocalStorage (e.g. job
+    cleanup) calls this so exists()/get_file_info() don't report them.
+    """
+    key = str(Path(path))
+    _stat_cache.pop(key, None)
+    if tree and _stat_cache:
+        prefix = key + os.sep
+        for cached in [k for k in _stat_cache if k.startswith(prefix)]:
+            del _stat_cache[cached]
+
+
+# O_DIRECT writes (Linux only): payloads of at least DIRECT_IO_MIN_BYTES bypass
+# the page cache, copied through a reusable page-aligned per-thread buffer
+_O_DIRECT = getattr(os, "O_DIRECT", 0)
+DIRECT_IO_MIN_BYTES = 1 << 20
+DIRECT_IO_BLOCK = 4096
+DIRECT_IO_BUFFER_SIZE = 2 << 20
+_direct_buffers = threading.local()
+
+
+def _write_direct(full_path: Path, data: bytes):
+    """
+    Write data with O_DIRECT (blocking).
+
+    The block-aligned prefix goes through the aligned buffer; the unaligned
+    tail is written with a normal buffered write. Filesystems that reject
+    O_DIRECT with EINVAL (tmpfs, some overlayfs setups) get a plain buffered
+    write of the whole payload instead.
+    """
+    buf = getattr(_direct_buffers, "buf", None)
+    if buf is None:
+        # Anonymous mmaps are page-aligned, as O_DIRECT requires
+        buf = _direct_buffers.buf = mmap.mmap(-1, DIRECT_IO_BUFFER_SIZE)
+
+    src = memoryview(data)
+    aligned_len = len(data) - len(data) % DIRECT_IO_BLOCK
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _O_DIRECT
+    try:
+        fd = os.open(full_path, flags, 0o644)
+    except OSError as e:
+        if e.errno != errno.EINVAL:
+            raise
+        full_path.write_bytes(data)
+        return
+
+    try:
+        offset = 0
+        with memoryview(buf) as dst:
+            while offset < aligned_len:
+                n = min(DIRECT_IO_BUFFER_SIZE, aligned_len - offset)
+                dst[:n] = src[offset : offset + n]
+                offset += os.write(fd, dst[:n])
+    except OSError as e:
+        if e.errno != errno.EINVAL:
+            raise
+        os.close(fd)
+        # Rewrites the file from the start (write_bytes truncates)
+        full_path.write_bytes(data)
+        return
+    else:
+        os.close(fd)
+
+    if aligned_len < len(data):
+        with open(full_path, "r+b") as f:
+            f.seek(aligned_len)
+            f.write(src[aligned_len:])
+
+
+def _write_atomic(full_path: Path, write: Callable[[Path], object]):
+    """
+    Write a file via a temporary sibling, then rename it into place (blocking).
+
+    write(tmp_path) produces the content. os.replace is atomic on POSIX, so
+    readers see either the previous file or the complete new one, never a
+    truncated write; a failed write leaves the previous file untouched.
+    """
+    tmp = full_path.with_name(
+        f"{full_path.name}.{os.getpid()}.{threading.get_ident()}.part"
+    )
+    try:
+        write(tmp)
+        os.replace(tmp, full_path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+# copy_file_range errors meaning "not supported here" rather than a real failure
+_COPY_RANGE_UNSUPPORTED = frozenset(
+    (errno.ENOSYS, errno.EXDEV, errno.EOPNOTSUPP, errno.EINVAL)
+)
+
+
+def _copy_file(src: Path, dst: Path):
+    """
+    Copy src to dst (blocking).
+
+    Uses copy_file_range (Linux 5.3+), which copies inside the kernel and can
+    reflink on copy-on-write filesystems; falls back to a regular copy.
+    """
+    copy_range = getattr(os, "copy_file_range", None)
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        if copy_range is not None:
+            in_fd, out_fd = fsrc.fileno(), fdst.fileno()
+            remaining = os.fstat(in_fd).st_size
+            try:
+                while remaining > 0:
+                    copied = copy_range(in_fd, out_fd, remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+                return
+            except OSError as e:
+                if e.errno not in _COPY_RANGE_UNSUPPORTED:
+                    raise
+                fsrc.seek(0)
+                fdst.seek(0)
+                fdst.truncate()
+        shutil.copyfileobj(fsrc, fdst)
+
+
+def _read_file(full_path: Path) -> bytes:
+    """
+    Read a whole file with a buffer sized from fstat (blocking).
+
+    os.read allocates the result bytes directly, so in the common case the
+    whole file lands in one exactly-sized object with no copy.
+    """
+    fd = os.open(full_path, os.O_RDONLY)
+    try:
+        return _read_fd(fd, os.fstat(fd).st_size)
+    finally:
+        os.close(fd)
+
+
+def _read_fd(fd: int, size: int) -> bytes:
+    """Read an open file to EOF, starting with one read of the expected size."""
+    chunks = [os.read(fd, size)] if size else []
+    # Read on to EOF in case of short reads or a file that grew
+    while chunk := os.read(fd, 1 << 16):
+        chunks.append(chunk)
+    return chunks[0] if len(chunks) == 1 else b"".join(chunks)
+
+
+# download_view maps files of at least this size instead of reading them
+MMAP_MIN_BYTES = 1 << 20
+
+
+def _map_file(full_path: Path) -> memoryview:
+    """
+    Return a read-only view of a file (blocking).
+
+    Large files are memory-mapped: concurrent readers share the page cache
+    pages instead of each holding a private copy. Small ones are read.
+    """
+    fd = os.open(full_path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        if size < MMAP_MIN_BYTES:
+            return memoryview(_read_fd(fd, size))
+        # The mapping stays valid after the descriptor is closed
+        return memoryview(mmap.mmap(fd, size, prot=mmap.PROT_READ))
+    finally:
+        os.close(fd)
+
+
+def _os_fd(file_data: BinaryIO) -> Optional[int]:
+    """Return the OS file descriptor behind a file object, if it has one."""
+    if isinstance(file_data, tempfile.SpooledTemporaryFile):
+        # Don't force an in-memory spooled file to disk just to get an fd
+        file_data = file_data._file
+    try:
+        return file_data.fileno()
+    except (AttributeError, OSError):
+        return None
+
 
 class BaseStorage(ABC):
     """Abstract base class for storage backends."""
@@ -63,21 +283,42 @@ class LocalStorage(BaseStorage):
     Stores files in the configured storage path.
     """
 
-    def __init__(self, base_path: Optional[str] = None):
+    def __init__(self, base_path: Optional[str] = None, direct: Optional[bool] = None):
         """
         Initialize local storage.
 
         Args:
             base_path: Base directory for file storage
+            direct: Write large byte payloads with O_DIRECT, bypassing the
+                page cache (Linux only; defaults to settings.storage_direct_io)
         """
+        if direct is None:
+            direct = settings.storage_direct_io
+        self.direct = bool(direct and _O_DIRECT)
         self.base_path = Path(base_path or settings.storage_path)
         self.base_path.mkdir(parents=True, exist_ok=True)
 
     def _get_full_path(self, path: str) -> Path:
         """Get the full filesystem path for a storage path."""
-        # Prevent path traversal attacks
-        safe_path = Path(path).as_posix().lstrip("/")
-        return self.base_path / safe_path
+        return _safe_join(self.base_path, path)
+
+    @staticmethod
+    def _cached_stat(key: str) -> Optional[os.stat_result]:
+        """Return a still-fresh stat result recorded by exists(), if any."""
+        entry = _stat_cache.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] > STAT_CACHE_TTL:
+            del _stat_cache[key]
+            return None
+        return entry[1]
+
+    @staticmethod
+    def _cache_stat(key: str, file_stat: os.stat_result):
+        """Record a stat result for the short-lived cache."""
+        if len(_stat_cache) >= STAT_CACHE_MAX_ENTRIES:
+            _stat_cache.clear()
+        _stat_cache[key] = (time.monotonic(), file_stat)
 
     async def upload(
         self,
@@ -99,18 +340,60 @@ class LocalStorage(BaseStorage):
         full_path = self._get_full_path(path)
 
         # Create parent directories
-        full_path.parent.mkdir(parents=True, exist_ok=True)
+        await asyncio.to_thread(full_path.parent.mkdir, parents=True, exist_ok=True)
 
-        # Write file
+        # Write file. open + write + rename happen in one worker-thread hop
+        # rather than one hop each.
         if isinstance(file_data, bytes):
-            full_path.write_bytes(file_data)
+            if self.direct and len(file_data) >= DIRECT_IO_MIN_BYTES:
+                write = partial(_write_direct, data=file_data)
+            else:
+                write = partial(Path.write_bytes, data=file_data)
         else:
             # File-like object
-            with open(full_path, "wb") as f:
-                shutil.copyfileobj(file_data, f)
+            write = partial(self._copy_fileobj, file_data)
+
+        await asyncio.to_thread(_write_atomic, full_path, write)
+        invalidate_stat_cache(full_path, tree=False)
 
         return path
 
+    @staticmethod
+    def _copy_fileobj(file_data: BinaryIO, full_path: Path):
+        """
+        Copy a file-like object to disk (blocking).
+
+        Objects backed by a regular OS file are copied in the kernel with
+        sendfile; anything else (pipes, sockets, in-memory files) is copied
+        through Python.
+        """
+        in_fd = _os_fd(file_data)
+        offset = end = None
+        if in_fd is not None:
+            in_stat = os.fstat(in_fd)
+            if stat.S_ISREG(in_stat.st_mode):
+                try:
+                    offset = file_data.tell()
+                except OSError:
+                    pass
+                end = in_stat.st_size
+
+        with open(full_path, "wb") as f:
+            if offset is None:
+                shutil.copyfileobj(file_data, f)
+                return
+
+            out_fd = f.fileno()
+            while offset < end:
+                sent = os.sendfile(out_fd, in_fd, offset, end - offset)
+                if sent == 0:
+                    break
+                offset += sent
+
+            # sendfile with an explicit offset doesn't move the file position;
+            # leave it past the copied data, as copyfileobj does
+            file_data.seek(offset)
+
     async def download(self, path: str) -> bytes:
         """
         Download a file from local storage.
@@ -126,15 +409,76 @@ class LocalStorage(BaseStorage):
         """
         full_path = self._get_full_path(path)
 
-        if not full_path.exists():
-            raise FileNotFoundError(f"File not found: {path}")
+        # One worker-thread hop
+        try:
+            return await asyncio.to_thread(_read_file, full_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {path}") from None
+
+    async def download_view(self, path: str) -> memoryview:
+        """
+        Download a file as a read-only memoryview.
+
+        Files of MMAP_MIN_BYTES or more are memory-mapped rather than copied,
+        so streaming responses can send them without a private copy. Call
+        bytes() on the view only where immutable bytes are really needed.
+
+        Args:
+            path: Storage path of the file
+
+        Returns:
+            Read-only view of the file content
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+        """
+        full_path = self._get_full_path(path)
+
+        try:
+            return await asyncio.to_thread(_map_file, full_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {path}") from None
+
+    async def copy(self, src: str, dst: str) -> str:
+        """
+        Copy a file to another storage path.
+
+        Args:
+            src: Storage path of the existing file
+            dst: Storage path for the copy
+
+        Returns:
+            The destination storage path
+
+        Raises:
+            FileNotFoundError: If the source file doesn't exist
+        """
+        src_path = self._get_full_path(src)
+        dst_path = self._get_full_path(dst)
+
+        await asyncio.to_thread(dst_path.parent.mkdir, parents=True, exist_ok=True)
+        try:
+            await asyncio.to_thread(
+                _write_atomic, dst_path, partial(_copy_file, src_path)
+            )
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {src}") from None
+        invalidate_stat_cache(dst_path, tree=False)
 
-        return full_path.read_bytes()
+        return dst
 
     async def exists(self, path: str) -> bool:
         """Check if a file exists in local storage."""
-        full_path = self._get_full_path(path)
-        return full_path.exists()
+        key = str(self._get_full_path(path))
+        if self._cached_stat(key) is not None:
+            return True
+
+        try:
+            file_stat = await asyncio.to_thread(os.stat, key)
+        except (FileNotFoundError, NotADirectoryError):
+            return False
+        self._cache_stat(key, file_stat)
+        return True
 
     async def delete(self, path: str) -> bool:
         """
@@ -147,12 +491,13 @@ class LocalStorage(BaseStorage):
             True if deleted, False if not found
         """
         full_path = self._get_full_path(path)
+        invalidate_stat_cache(full_path, tree=False)
 
-        if full_path.exists():
-            full_path.unlink()
+        try:
+            await asyncio.to_thread(full_path.unlink)
             return True
-
-        return False
+        except FileNotFoundError:
+            return False
 
     async def delete_directory(self, path: str) -> bool:
         """
@@ -165,12 +510,52 @@ class LocalStorage(BaseStorage):
             True if deleted, False if not found
         """
         full_path = self._get_full_path(path)
+        invalidate_stat_cache(full_path)
 
-        if full_path.exists() and full_path.is_dir():
-            shutil.rmtree(full_path)
+        # lstat, not is_dir: a symlink to a directory must not be walked, or
+        # files outside storage would be unlinked (rmtree refuses them too)
+        try:
+            root_stat = await asyncio.to_thread(os.lstat, full_path)
+        except FileNotFoundError:
+            return False
+        if not stat.S_ISDIR(root_stat.st_mode):
+            return False
+
+        files, dirs = await asyncio.to_thread(self._collect_tree, str(full_path))
+        if len(files) <= PARALLEL_DELETE_MIN_FILES:
+            await asyncio.to_thread(shutil.rmtree, full_path)
             return True
 
-        return False
+        # Unlink latency (network filesystems, spinning disks) overlaps across
+        # threads; directories are removed afterwards, deepest first
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(
+            *(loop.run_in_executor(_unlink_executor, os.unlink, f) for f in files)
+        )
+        await asyncio.to_thread(self._remove_dirs, dirs)
+        return True
+
+    @staticmethod
+    def _collect_tree(root: str) -> tuple[list[str], list[str]]:
+        """List files and directories under root (directories parents-first)."""
+        files: list[str] = []
+        dirs: list[str] = [root]
+        stack = [root]
+        while stack:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        dirs.append(entry.path)
+                        stack.append(entry.path)
+                    else:
+                        files.append(entry.path)
+        return files, dirs
+
+    @staticmethod
+    def _remove_dirs(dirs: list[str]):
+        """Remove now-empty directories, children before parents."""
+        for directory in reversed(dirs):
+            os.rmdir(directory)
 
     async def get_url(self, path: str, expires_in: int = 3600) -> str:
         """
@@ -199,15 +584,29 @@ class LocalStorage(BaseStorage):
             List of file paths
         """
         dir_path = self._get_full_path(directory)
+        return await asyncio.to_thread(self._list_files_sync, dir_path)
 
-        if not dir_path.exists():
-            return []
+    def _list_files_sync(self, dir_path: Path) -> list[str]:
+        """
+        Walk a directory for list_files (blocking).
 
+        Uses os.scandir: entry types come from the directory listing itself,
+        so no per-file stat or Path objects are needed.
+        """
+        base = str(self.base_path)
         files = []
-        for item in dir_path.rglob("*"):
-            if item.is_file():
-                rel_path = item.relative_to(self.base_path)
-                files.append(str(rel_path))
+        stack = [str(dir_path)]
+        while stack:
+            try:
+                entries = os.scandir(stack.pop())
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        files.append(os.path.relpath(entry.path, base))
 
         return files
 
@@ -219,22 +618,45 @@ class LocalStorage(BaseStorage):
             path: Storage path of the file
 
         Returns:
-            Dict with file info or None if not found
+            Dict with file info or None if not found. Timestamps are
+            epoch seconds; callers needing datetimes convert them with
+            datetime.fromtimestamp.
         """
-        full_path = self._get_full_path(path)
+        key = str(self._get_full_path(path))
 
-        if not full_path.exists():
-            return None
+        # Reuse the stat from a just-preceding exists() check
+        file_stat = self._cached_stat(key)
+        if file_stat is None:
+            try:
+                file_stat = await asyncio.to_thread(os.stat, key)
+            except FileNotFoundError:
+                return None
 
-        stat = full_path.stat()
         return {
             "path": path,
-            "size": stat.st_size,
-            "created_at": datetime.fromtimestamp(stat.st_ctime),
-            "modified_at": datetime.fromtimestamp(stat.st_mtime),
+            "size": file_stat.st_size,
+            "created_at": file_stat.st_ctime,
+            "modified_at": file_stat.st_mtime,
         }
 
 
+# Uploads below this size use a single put_object; larger ones (and large
+# downloads) are transferred as parts of this size, several at a time
+MULTIPART_CHUNK_SIZE = 8 * 1024 * 1024
+MULTIPART_CONCURRENCY = 10
+# Downloads above this size are fetched as parallel ranged GETs
+RANGED_DOWNLOAD_MIN_BYTES = 10 * 1024 * 1024
+
+
+# Object metadata key holding the hex BLAKE2b digest of uploaded bytes
+CONTENT_DIGEST_KEY = "content-blake2b"
+
+
+def _content_digest(data: bytes) -> str:
+    """Hash upload content for the object's metadata."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
 class S3Storage(BaseStorage):
     """
     S3-compatible storage backend.
@@ -266,29 +688,56 @@ class S3Storage(BaseStorage):
         self.secret_key = secret_key or settings.s3_secret_key
         self.region = region or settings.s3_region
 
+        try:
+            import aioboto3
+        except ImportError:
+            raise ImportError(
+                "aioboto3 is required for S3 storage. "
+                "Install it with: pip install aioboto3"
+            )
+
+        self._session = aioboto3.Session()
         self._client = None
+        self._client_lock = asyncio.Lock()
+        # HTTP client for presigned-URL fetches, shared so connections and TLS
+        # sessions to the bucket host are reused
+        self._http: Optional[httpx.AsyncClient] = None
 
     async def _get_client(self):
         """Get or create the S3 client."""
-        if self._client is None:
-            try:
-                import aioboto3
+        if self._client is not None:
+            return self._client
 
-                session = aioboto3.Session()
-                self._client = await session.client(
+        # Concurrent first calls must not each create a client
+        async with self._client_lock:
+            if self._client is None:
+                self._client = await self._session.client(
                     "s3",
                     endpoint_url=self.endpoint,
                     aws_access_key_id=self.access_key,
                     aws_secret_access_key=self.secret_key,
                     region_name=self.region,
                 ).__aenter__()
-            except ImportError:
-                raise ImportError(
-                    "aioboto3 is required for S3 storage. "
-                    "Install it with: pip install aioboto3"
-                )
         return self._client
 
+    async def _get_http(self) -> httpx.AsyncClient:
+        """Get or create the HTTP client for presigned-URL fetches."""
+        if self._http is not None:
+            return self._http
+
+        # Same lock as the S3 client: concurrent first calls share one client
+        async with self._client_lock:
+            if self._http is None:
+                self._http = httpx.AsyncClient(
+                    timeout=60.0,
+                    limits=httpx.Limits(
+                        max_connections=100,
+                        max_keepalive_connections=100,
+                        keepalive_expiry=60.0,
+                    ),
+                )
+        return self._http
+
     async def upload(
         self,
         file_data: bytes | BinaryIO,
@@ -313,19 +762,53 @@ class S3Storage(BaseStorage):
             extra_args["ContentType"] = content_type
 
         if isinstance(file_data, bytes):
+            # Content hash stored as object metadata (BLAKE2b is much cheaper
+            # than MD5); large payloads hash in a thread and are skipped if the
+            # object already holds the same content
+            large = len(file_data) >= MULTIPART_CHUNK_SIZE
+            if large:
+                digest = await asyncio.to_thread(_content_digest, file_data)
+                if await self._has_content(client, path, digest):
+                    return path
+            else:
+                digest = _content_digest(file_data)
+            extra_args["Metadata"] = {CONTENT_DIGEST_KEY: digest}
+
+            # Small payloads: one PUT, no multipart machinery or BytesIO wrapper
+            if not large:
+                await client.put_object(
+                    Bucket=self.bucket, Key=path, Body=file_data, **extra_args
+                )
+                return path
+
             import io
 
             file_data = io.BytesIO(file_data)
 
+        from boto3.s3.transfer import TransferConfig
+
         await client.upload_fileobj(
             file_data,
             self.bucket,
             path,
             ExtraArgs=extra_args,
+            Config=TransferConfig(
+                multipart_threshold=MULTIPART_CHUNK_SIZE,
+                multipart_chunksize=MULTIPART_CHUNK_SIZE,
+                max_concurrency=MULTIPART_CONCURRENCY,
+            ),
         )
 
         return path
 
+    async def _has_content(self, client, path: str, digest: str) -> bool:
+        """Check whether the object at path already has this content digest."""
+        try:
+            head = await client.head_object(Bucket=self.bucket, Key=path)
+        except Exception:
+            return False
+        return head.get("Metadata", {}).get(CONTENT_DIGEST_KEY) == digest
+
     async def download(self, path: str) -> bytes:
         """
         Download a file from S3.
@@ -336,15 +819,30 @@ class S3Storage(BaseStorage):
         Returns:
             File content as bytes
         """
-        import io
-
         client = await self._get_client()
 
-        buffer = io.BytesIO()
-        await client.download_fileobj(self.bucket, path, buffer)
-        buffer.seek(0)
+        head = await client.head_object(Bucket=self.bucket, Key=path)
+        size = head["ContentLength"]
+
+        if size <= RANGED_DOWNLOAD_MIN_BYTES:
+            response = await client.get_object(Bucket=self.bucket, Key=path)
+            return await response["Body"].read()
+
+        # Large objects: fetch fixed-size ranges concurrently, then join them
+        semaphore = asyncio.Semaphore(MULTIPART_CONCURRENCY)
+
+        async def fetch_part(start: int) -> bytes:
+            end = min(start + MULTIPART_CHUNK_SIZE, size) - 1
+            async with semaphore:
+                response = await client.get_object(
+                    Bucket=self.bucket, Key=path, Range=f"bytes={start}-{end}"
+                )
+                return await response["Body"].read()
 
-        return buffer.read()
+        parts = await asyncio.gather(
+            *(fetch_part(start) for start in range(0, size, MULTIPART_CHUNK_SIZE))
+        )
+        return b"".join(parts)
 
     async def exists(self, path: str) -> bool:
         """Check if a file exists in S3."""
@@ -374,6 +872,48 @@ class S3Storage(BaseStorage):
         except Exception:
             return False
 
+    async def delete_prefix(self, prefix: str) -> int:
+        """
+        Delete every object whose key starts with prefix.
+
+        Keys are removed in DeleteObjects batches of up to 1000.
+
+        Args:
+            prefix: Key prefix (e.g. "output/<job_id>/")
+
+        Returns:
+            Number of objects deleted
+
+        Raises:
+            RuntimeError: If any key could not be deleted (raised after every
+                batch has been attempted)
+        """
+        client = await self._get_client()
+        paginator = client.get_paginator("list_objects_v2")
+
+        deleted = 0
+        errors: list[dict] = []
+        # list_objects_v2 pages hold at most 1000 keys, the DeleteObjects limit
+        async for page in paginator.paginate(Bucket=self.bucket, Prefix=prefix):
+            batch = [{"Key": obj["Key"]} for obj in page.get("Contents", [])]
+            if not batch:
+                continue
+            # Not quiet: the response lists what was actually deleted
+            response = await client.delete_objects(
+                Bucket=self.bucket, Delete={"Objects": batch, "Quiet": False}
+            )
+            deleted += len(response.get("Deleted", []))
+            errors.extend(response.get("Errors", []))
+
+        if errors:
+            first = errors[0]
+            raise RuntimeError(
+                f"Failed to delete {len(errors)} object(s) under '{prefix}' "
+                f"(e.g. {first.get('Key')}: {first.get('Code')} {first.get('Message')})"
+            )
+
+        return deleted
+
     async def get_url(self, path: str, expires_in: int = 3600) -> str:
         """
         Get a presigned URL to access the file.
@@ -395,11 +935,36 @@ class S3Storage(BaseStorage):
 
         return url
 
+    async def fetch_presigned(self, path: str, expires_in: int = 300) -> bytes:
+        """
+        Fetch an object over HTTP through a presigned URL.
+
+        Args:
+            path: S3 key of the file
+            expires_in: Lifetime of the generated URL in seconds
+
+        Returns:
+            File content as bytes
+        """
+        url = await self.get_url(path, expires_in)
+        http = await self._get_http()
+
+        response = await http.get(url)
+        response.raise_for_status()
+        return response.content
+
     async def close(self):
         """Close the S3 client."""
         if self._client:
             await self._client.__aexit__(None, None, None)
             self._client = None
+        if self._http:
+            await self._http.aclose()
+            self._http = None
+
+
+# Default number of uploads StorageService.upload_many keeps in flight
+UPLOAD_MANY_CONCURRENCY = 64
 
 
 class StorageService:
@@ -419,35 +984,43 @@ class StorageService:
         else:
             self._backend = LocalStorage()
 
+        # Plain pass-through operations are the backend's bound methods, so
+        # calls skip a wrapper coroutine frame
+        self.upload = self._backend.upload
+        self.download = self._backend.download
+        self.exists = self._backend.exists
+        self.delete = self._backend.delete
+        self.get_url = self._backend.get_url
+
     @property
     def backend(self) -> BaseStorage:
         """Get the underlying storage backend."""
         return self._backend
 
-    async def upload(
+    async def upload_many(
         self,
-        file_data: bytes | BinaryIO,
-        path: str,
-        content_type: Optional[str] = None,
-    ) -> str:
-        """Upload a file."""
-        return await self._backend.upload(file_data, path, content_type)
+        items: list[tuple[str, bytes | BinaryIO]],
+        concurrency: int = UPLOAD_MANY_CONCURRENCY,
+    ) -> list[str]:
+        """
+        Upload several files concurrently.
 
-    async def download(self, path: str) -> bytes:
-        """Download a file."""
-        return await self._backend.download(path)
+        Args:
+            items: (path, file_data) pairs
+            concurrency: Maximum number of uploads in flight
 
-    async def exists(self, path: str) -> bool:
-        """Check if a file exists."""
-        return await self._backend.exists(path)
+        Returns:
+            Storage paths, in the order of items
+        """
+        semaphore = asyncio.Semaphore(concurrency)
 
-    async def delete(self, path: str) -> bool:
-        """Delete a file."""
-        return await self._backend.delete(path)
+        async def upload_one(path: str, file_data: bytes | BinaryIO) -> str:
+            async with semaphore:
+                return await self._backend.upload(file_data, path)
 
-    async def get_url(self, path: str, expires_in: int = 3600) -> str:
-        """Get a URL to access the file."""
-        return await self._backend.get_url(path, expires_in)
+        return await asyncio.gather(
+            *(upload_one(path, file_data) for path, file_data in items)
+        )
 
     async def upload_job_file(
         self,
@@ -496,9 +1069,10 @@ class StorageService:
             await self._backend.delete_directory(f"uploads/{job_id}")
             await self._backend.delete_directory(f"output/{job_id}")
         else:
-            # For S3, would need to list and delete objects
-            # This is a simplified implementation
-            pass
+            await asyncio.gather(
+                self._backend.delete_prefix(f"uploads/{job_id}/"),
+                self._backend.delete_prefix(f"output/{job_id}/"),
+            )
 
 
 # Global storage service instance